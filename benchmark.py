@@ -0,0 +1,256 @@
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Optional
+
+from common.memory import MemoryUsage, format_size, trace_memory
+from input_generator import GENERATORS, write_input
+from runner import get_available_days, get_input, get_module, parse_days
+
+# Times every solver part and compares it against stored baselines
+#   python -m benchmark 1-25 --repeat 5            (check for regressions)
+#   python -m benchmark 15,19 --save               (record new baselines)
+#   python -m benchmark 9 --sizes 100,200,400      (time versus input size)
+#   python -m benchmark 5,22 --memory              (peak memory as well)
+#
+# the best of the repeated runs is kept, and a part regresses when it is
+# slower than its baseline by more than the threshold (a fraction); with
+# --memory the same goes for its peak memory
+
+BASELINE_FILENAME = "benchmarks.json"
+# peaks below this are not worth failing a run over
+MIN_PEAK_MEMORY = 1 << 20
+
+
+@dataclass
+class Timing:
+    name: str
+    seconds: float
+    memory: Optional[MemoryUsage] = None
+
+
+@dataclass
+class Regression:
+    key: str
+    name: str
+    # "seconds" or "bytes"
+    unit: str
+    baseline: float
+    value: float
+
+    def __str__(self) -> str:
+        if self.unit == "bytes":
+            before, after = format_size(self.baseline), format_size(self.value)
+        else:
+            before, after = f"{self.baseline:.4f}s", f"{self.value:.4f}s"
+        return (f"{self.name}: {before} -> {after} "
+                f"({self.value / self.baseline - 1:+.0%})")
+
+
+def get_key(day: int, part: int) -> str:
+    return f"{day}.{part}"
+
+
+def get_name(day: int, part: int, func: Callable) -> str:
+    name = func.__name__
+    return f"challenge{day}.part{part}" if name == "<lambda>" \
+        else f"challenge{day}.{name}"
+
+
+def clear_caches(module):
+    # memoised helpers would make every repeat after the first free
+    for value in vars(module).values():
+        if hasattr(value, "cache_clear"):
+            value.cache_clear()
+
+
+def time_part(day: int, part: int, repeat: int,
+              data: Optional[Any] = None, memory: bool = False) -> Timing:
+    module = get_module(day)
+    if data is None:
+        data = get_input(module)
+    func = module.PARTS[part - 1]
+    best = float("inf")
+    for _ in range(repeat):
+        clear_caches(module)
+        start = time.perf_counter()
+        func(data)
+        best = min(best, time.perf_counter() - start)
+    timing = Timing(get_name(day, part, func), best)
+    if memory:
+        # traced separately, tracemalloc would skew the timings
+        clear_caches(module)
+        _, timing.memory = trace_memory(func, data)
+    return timing
+
+
+def print_timing(timing: Timing):
+    line = f"{timing.name:55} {timing.seconds:10.4f}s"
+    if timing.memory:
+        line += f" {format_size(timing.memory.peak):>10} peak"
+        for site in timing.memory.sites:
+            line += f"\n    {format_size(site.size):>10} {site.location}"
+    print(line, flush=True)
+
+
+def run_benchmarks(days: list[int], repeat: int, memory: bool = False
+                   ) -> tuple[dict[str, Timing], list[str]]:
+    timings = {}
+    failures = []
+    for day in days:
+        for part in range(1, len(get_module(day).PARTS) + 1):
+            try:
+                timing = time_part(day, part, repeat, memory=memory)
+            except Exception as error:  # pylint: disable=broad-except
+                print(f"FAILED challenge{day} part {part}: {error!r}")
+                failures.append(get_key(day, part))
+                continue
+            print_timing(timing)
+            timings[get_key(day, part)] = timing
+    return timings, failures
+
+
+def get_exponent(previous: tuple[int, float], current: tuple[int, float]
+                 ) -> Optional[float]:
+    # slope on a log-log plot: ~1 for linear, ~2 for quadratic and so on
+    (size1, seconds1), (size2, seconds2) = previous, current
+    if min(seconds1, seconds2) <= 0 or size1 == size2:
+        return None
+    return math.log(seconds2 / seconds1) / math.log(size2 / size1)
+
+
+def run_scaling(days: list[int], sizes: list[int], repeat: int,
+                seed: int) -> dict[str, list[tuple[int, float]]]:
+    curves: dict[str, list[tuple[int, float]]] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for day in days:
+            generator = GENERATORS.get(day)
+            if generator is None:
+                print(f"No input generator for day {day}")
+                continue
+            module = get_module(day)
+            for size in sizes:
+                filename = os.path.join(directory, f"input{day}_{size}.txt")
+                write_input(day, size, filename, seed)
+                data = module.INPUT.parser(filename)
+                for part in generator.parts:
+                    timing = time_part(day, part, repeat, data)
+                    curve = curves.setdefault(timing.name, [])
+                    curve.append((size, timing.seconds))
+                    print_scaling(timing, generator.unit, curve)
+    return curves
+
+
+def print_scaling(timing: Timing, unit: str, curve: list[tuple[int, float]]):
+    exponent = get_exponent(*curve[-2:]) if len(curve) > 1 else None
+    print(f"{timing.name:55} {curve[-1][0]:8} {unit:16} "
+          f"{timing.seconds:10.4f}s"
+          + (f"  ~n^{exponent:.2f}" if exponent else ""), flush=True)
+
+
+def load_baselines(filename: str) -> dict[str, Timing]:
+    if not os.path.exists(filename):
+        return {}
+    with open(filename, encoding="utf-8") as f:
+        baselines = json.load(f)
+    return {key: Timing(value["name"], value["seconds"],
+                        MemoryUsage.from_dict(value["memory"])
+                        if value.get("memory") else None)
+            for key, value in baselines.items()}
+
+
+def save_baselines(filename: str, timings: dict[str, Timing]):
+    baselines = load_baselines(filename)
+    baselines.update(timings)
+    ordered = sorted(baselines.items(),
+                     key=lambda item: tuple(map(int, item[0].split('.'))))
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump({key: asdict(timing) for key, timing in ordered}, f,
+                  indent=2)
+        f.write('\n')
+
+
+def find_regressions(timings: dict[str, Timing],
+                     baselines: dict[str, Timing],
+                     threshold: float,
+                     min_seconds: float) -> list[Regression]:
+    regressions = []
+    for key, timing in timings.items():
+        baseline: Optional[Timing] = baselines.get(key)
+        if baseline is None:
+            continue
+        if (timing.seconds >= min_seconds and
+                timing.seconds > baseline.seconds * (1 + threshold)):
+            regressions.append(Regression(key, timing.name, "seconds",
+                                          baseline.seconds, timing.seconds))
+        if (timing.memory and baseline.memory and
+                timing.memory.peak >= MIN_PEAK_MEMORY and
+                timing.memory.peak > baseline.memory.peak * (1 + threshold)):
+            regressions.append(Regression(key, timing.name, "bytes",
+                                          baseline.memory.peak,
+                                          timing.memory.peak))
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the solvers")
+    parser.add_argument("days", nargs='?', default=None,
+                        help="days to run, e.g. 1-25 or 1,3,5-7 "
+                             "(default: every challenge)")
+    parser.add_argument("--repeat", "-r", type=int, default=3,
+                        help="number of timed runs per part")
+    parser.add_argument("--threshold", "-t", type=float, default=0.25,
+                        help="allowed slowdown before failing, as a fraction")
+    parser.add_argument("--min-seconds", type=float, default=0.01,
+                        help="ignore parts faster than this (timer noise)")
+    parser.add_argument("--baselines", default=BASELINE_FILENAME,
+                        help="JSON file holding the baseline timings")
+    parser.add_argument("--save", action="store_true",
+                        help="record the timings as the new baselines")
+    parser.add_argument("--memory", action="store_true",
+                        help="also trace each part's peak memory and top "
+                             "allocation sites")
+    parser.add_argument("--sizes",
+                        help="time generated inputs of these sizes instead, "
+                             "e.g. 100,200,400")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed for the generated inputs")
+    parser.add_argument("--curves",
+                        help="JSON file to write the --sizes timings to")
+    args = parser.parse_args()
+
+    days = parse_days(args.days) if args.days else get_available_days()
+    if args.sizes:
+        sizes = [int(size) for size in args.sizes.split(',')]
+        curves = run_scaling(days, sizes, args.repeat, args.seed)
+        if args.curves:
+            with open(args.curves, "w", encoding="utf-8") as f:
+                json.dump(curves, f, indent=2)
+                f.write('\n')
+        return 0
+
+    timings, failures = run_benchmarks(days, args.repeat, args.memory)
+    if args.save:
+        save_baselines(args.baselines, timings)
+        print(f"Saved {len(timings)} baselines to {args.baselines}")
+        return 1 if failures else 0
+
+    baselines = load_baselines(args.baselines)
+    missing = [key for key in timings if key not in baselines]
+    if missing:
+        print(f"No baseline for {', '.join(missing)}")
+    regressions = find_regressions(timings, baselines, args.threshold,
+                                   args.min_seconds)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions or failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
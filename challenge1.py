@@ -1,20 +1,63 @@
-from common.file_input import read_numbers
+import itertools
+import operator
+import sys
+
+from typing import Any, Iterable
+
+from common.file_input import LazyInput, read_numbers
+
+Measurements = Iterable[int]
+# readings compared per numpy call, which bounds its temporary arrays
+ARRAY_BLOCK_SIZE = 1 << 22
+
+# two neighboring windows of the same size share everything but their ends,
+# so window i + 1 has the bigger sum exactly when measurement i + size is
+# bigger than measurement i. The tee only holds the size measurements
+# between its two iterators, a ring buffer that works for any iterable
+def get_number_of_increasing_windows(measurements: Measurements,
+                                     size: int) -> int:
+    assert size > 0, f"Bad window size {size}"
+    if _is_array(measurements):
+        return _get_number_of_increasing_windows(measurements, size)
+    earlier, later = itertools.tee(measurements)
+    return sum(map(operator.gt, itertools.islice(later, size, None), earlier))
+
+# nobody can hand over a numpy array without having imported numpy, so
+# lists and files never need it
+def _is_array(measurements: Measurements) -> bool:
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(measurements, numpy.ndarray)
+
+def _get_number_of_increasing_windows(array: Any, size: int) -> int:
+    import numpy as np # pylint: disable=import-outside-toplevel
+    pairs = len(array) - size
+    increases = 0
+    for start in range(0, pairs, ARRAY_BLOCK_SIZE):
+        stop = min(start + ARRAY_BLOCK_SIZE, pairs)
+        increases += int(np.count_nonzero(
+            array[start + size:stop + size] > array[start:stop]))
+    return increases
 
-Measurements = list[int]
 def get_number_of_increasing_measurements(measurements: Measurements) -> int:
-    measurement_pairs = zip(measurements, measurements[1:])
-    return len([p for p in measurement_pairs if p[1] > p[0]])
+    return get_number_of_increasing_windows(measurements, 1)
 
 def get_number_of_increasing_sliding_windows(
                                         measurements: Measurements) -> int:
-    measurement_sums = [sum(w) for w in
-                           zip(measurements, measurements[1:], measurements[2:])]
-    return get_number_of_increasing_measurements(measurement_sums)
+    return get_number_of_increasing_windows(measurements, 3)
+
+
+
+INPUT = LazyInput('input/input1.txt', read_numbers)
+__getattr__ = INPUT.as_attribute("MEASUREMENTS")
 
+PARTS = (get_number_of_increasing_measurements,
+         get_number_of_increasing_sliding_windows)
 
+def solve(path: str) -> tuple:
+    return INPUT.solve(path, PARTS)
 
-MEASUREMENTS = read_numbers('input/input1.txt')
 if __name__ == "__main__":
+    MEASUREMENTS = INPUT.get()
     print(f"Number of increasing measurments:  "
           f"{get_number_of_increasing_measurements(MEASUREMENTS)}")
 
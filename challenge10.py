@@ -1,8 +1,9 @@
-from typing import Callable
+from typing import Callable, Iterable
 
-from common.file_input import read_multiline
+from common.file_input import LazyInput, read_multiline
 
-LINES = read_multiline("input/input10.txt")
+INPUT: LazyInput[list[str]] = LazyInput("input/input10.txt", read_multiline)
+__getattr__ = INPUT.as_attribute("LINES")
 
 CLOSING_LETTER = {
     '[': ']',
@@ -10,7 +11,7 @@ CLOSING_LETTER = {
     '<': '>',
     '(': ')'
 }
-def get_corrupted_score(lines: list[str]) -> int:
+def get_corrupted_score(lines: Iterable[str]) -> int:
     return sum(get_corrupt_score(line) for line in lines)
 
 def get_corrupt_score(line: str) -> int:
@@ -28,7 +29,7 @@ def get_corrupt_score(line: str) -> int:
     parse(line, on_corrupt=set_corrupt_score)
     return score
 
-def get_incomplete_score(lines: list[str]) -> int:
+def get_incomplete_score(lines: Iterable[str]) -> int:
     scores = [score for line in lines
                if (score := get_incompleted_score(line))]
     return sorted(scores)[len(scores) // 2]
@@ -67,6 +68,12 @@ def parse(line: str,
     if stack:
         on_incomplete(''.join(stack))
 
+PARTS = (get_corrupted_score, get_incomplete_score)
+
+def solve(path: str) -> tuple:
+    return INPUT.solve(path, PARTS)
+
 if __name__ == "__main__":
+    LINES = INPUT.get()
     print(f"Corrupted Score: {get_corrupted_score(LINES)}")
     print(f"Incomplete Score: {get_incomplete_score(LINES)}")
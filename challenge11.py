@@ -1,51 +1,67 @@
 import itertools
-from copy import deepcopy
-from typing import Optional
 
-from common.file_input import read_multiline
-from common.grid import Grid
+from common.automaton import Automaton
+from common.file_input import LazyInput
+from common.grid import DenseGrid
 
-Octopus = Optional[int]
+# an octopus that has flashed this step, it can't take any more energy;
+# the border around the grid is made of these so it never lights up
+FLASHED = 0xFF
+INCREMENT = bytes(range(1, FLASHED + 1)) + bytes([FLASHED])
+RESET = bytes([0]) + bytes(range(1, FLASHED)) + bytes([0])
 
-def get_number_of_flashes(octopodes: Grid[Octopus]) -> int:
-    return sum(flash(octopodes) for _ in range(100))
+def get_number_of_flashes(octopodes: DenseGrid) -> int:
+    automaton = Automaton(octopodes, background=FLASHED)
+    return sum(flash(automaton) for _ in range(100))
 
-def get_synchronization(octopodes: Grid[Octopus]) -> int:
+def get_synchronization(octopodes: DenseGrid) -> int:
+    automaton = Automaton(octopodes, background=FLASHED)
     for num in itertools.count(start=1):
-        flash(octopodes)
+        flash(automaton)
         # they all just flashed
-        if all(o == 0 for o in octopodes.values()):
+        if automaton.count(0) == len(automaton):
             return num
 
     raise RuntimeError("Should never get here")
 
-def flash(octopodes: Grid[Octopus]) -> int:
-    flashes = 0
+# the flashes set each other off within a single step, so rather than
+# sweeping the whole grid until it settles only the octopodes that are about
+# to flash are visited
+def flash(automaton: Automaton) -> int:
+    automaton.apply_table(INCREMENT)
+    cells = automaton.cells
+    neighbor_offsets = automaton.neighbor_offsets()
 
-    for point in octopodes:
-        octopodes[point] += 1
+    potentials = []
+    index = cells.find(10)
+    while index != -1:
+        potentials.append(index)
+        index = cells.find(10, index + 1)
 
-    potentials = [point for point, octopus in octopodes.items()
-                  if octopus == 10]
+    flashes = 0
     while potentials:
-        point = potentials.pop(0)
-        for neighbor_point,neighbor in octopodes.get_neighbors(point, None,
-                                                               diagonal=True):
-            if neighbor and neighbor != 10:
-                #update original grid point
-                octopodes[neighbor_point] += 1
-                # it's getting bumped to >9
-                if neighbor == 9:
-                    potentials.append(neighbor_point)
-    # reset and count flashes
-    for point, octopus in octopodes.items():
-        if octopus == 10:
-            flashes += 1
-            octopodes[point] = 0
+        index = potentials.pop()
+        cells[index] = FLASHED
+        flashes += 1
+        for offset in neighbor_offsets:
+            energy = cells[index + offset]
+            # anything at 10 or more is already waiting to flash
+            if energy < 10:
+                cells[index + offset] = energy + 1
+                if energy == 9:
+                    potentials.append(index + offset)
+    automaton.apply_table(RESET)
     return flashes
 
-OCTOPODES: Grid[Octopus] = Grid(read_multiline("input/input11.txt"), int)
+INPUT: LazyInput[DenseGrid] = LazyInput("input/input11.txt", DenseGrid.from_file)
+__getattr__ = INPUT.as_attribute("OCTOPODES")
+
+PARTS = (get_number_of_flashes, get_synchronization)
+
+def solve(path: str) -> tuple:
+    return INPUT.solve(path, PARTS)
 
 if __name__ == "__main__":
-    print(f"# of flashes: {get_number_of_flashes(deepcopy(OCTOPODES))}")
-    print(f"Synchronization: {get_synchronization(deepcopy(OCTOPODES))}")
+    OCTOPODES = INPUT.get()
+    print(f"# of flashes: {get_number_of_flashes(OCTOPODES)}")
+    print(f"Synchronization: {get_synchronization(OCTOPODES)}")
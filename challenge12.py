@@ -1,5 +1,5 @@
 from collections import defaultdict
-from common.file_input import read_multiline
+from common.file_input import LazyInput, read_multiline
 
 
 def to_path(text: str) -> tuple[str, str]:
@@ -51,9 +51,17 @@ def build_graph(paths: list[tuple[str, str]]) -> dict[str, list[str]]:
     return graph
 
 
-PATHS = read_multiline("input/input12.txt", to_path)
+INPUT: LazyInput[list[tuple[str, str]]] = LazyInput(
+    "input/input12.txt", lambda f: read_multiline(f, to_path))
+__getattr__ = INPUT.as_attribute("PATHS")
+
+PARTS = (get_number_of_distinct_paths, get_number_of_modified_paths)
+
+def solve(path: str) -> tuple:
+    return INPUT.solve(path, PARTS)
 
 if __name__ == "__main__":
+    PATHS = INPUT.get()
     print(f"Number of distinct paths: {get_number_of_distinct_paths(PATHS)}")
     print(f"Number of distinct paths (single cave twice): "
           f"{get_number_of_modified_paths(PATHS)}")
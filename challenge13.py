@@ -3,6 +3,8 @@ import re
 from dataclasses import dataclass
 from enum import Enum
 
+from common.file_input import LazyInput
+
 class Direction(Enum):
     HORIZONTAL = "H"
     VERTICAL = "Y"
@@ -47,7 +49,7 @@ def make_fold(points: list[Point], fold: Fold) -> list[Point]:
                     for x,y in to_be_reversed]
     return list(set([*normal_half, *reverse]))
 
-def show_code(instructions: Instructions):
+def get_code(instructions: Instructions) -> str:
     points = instructions.points
     for instruction in instructions.folds:
         points = make_fold(points, instruction)
@@ -55,16 +57,29 @@ def show_code(instructions: Instructions):
     unique_points = set(points)
     xes = [x for x, _ in points]
     yes = [y for _, y in points]
+    rows = []
     for row in range(min(yes), max(yes)+1):
-        for column in range(min(xes), max(xes)+1):
-            letter = '*' if (column, row) in unique_points else ' '
-            print(letter, end="")
-        print()
+        rows.append(''.join('*' if (column, row) in unique_points else ' '
+                            for column in range(min(xes), max(xes)+1)))
+    return '\n'.join(rows)
+
+def show_code(instructions: Instructions):
+    print(get_code(instructions))
+
+def read_instructions(filename: str) -> Instructions:
+    with open(filename, encoding="utf-8") as f:
+        return to_instructions(f.readlines())
+
+INPUT = LazyInput("input/input13.txt", read_instructions)
+__getattr__ = INPUT.as_attribute("INSTRUCTIONS")
+
+PARTS = (get_visible_points_after_first_fold, get_code)
 
-with open("input/input13.txt", encoding="utf-8") as f:
-    INSTRUCTIONS = to_instructions(f.readlines())
+def solve(path: str) -> tuple:
+    return INPUT.solve(path, PARTS)
 
 if __name__ == "__main__":
+    INSTRUCTIONS = INPUT.get()
     print(f"Points visible after first fold: "
           f"{get_visible_points_after_first_fold(INSTRUCTIONS)}")
     show_code(INSTRUCTIONS)
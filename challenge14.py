@@ -1,5 +1,7 @@
 from collections import Counter
 
+from common.file_input import LazyInput
+
 Rule = tuple[str, str]
 Polymers = tuple[str, list[Rule]]
 def to_polymers(text: list[str]) -> Polymers:
@@ -42,10 +44,22 @@ def convert_rule(pair: str, rules: list[Rule]) -> list[str]:
 
 
 
-with open("input/input14.txt", encoding="utf-8") as f:
-    POLYMERS = to_polymers(f.readlines())
+def read_polymers(filename: str) -> Polymers:
+    with open(filename, encoding="utf-8") as f:
+        return to_polymers(f.readlines())
+
+INPUT = LazyInput("input/input14.txt", read_polymers)
+__getattr__ = INPUT.as_attribute("POLYMERS")
+
+PARTS = (get_difference_of_most_and_least_common,
+         lambda polymers: get_difference_of_most_and_least_common(polymers,
+                                                                  times=40))
+
+def solve(path: str) -> tuple:
+    return INPUT.solve(path, PARTS)
 
 if __name__ == "__main__":
+    POLYMERS = INPUT.get()
     print(f"Difference: {get_difference_of_most_and_least_common(POLYMERS)}")
     print(f"Difference (40): "
           f"{get_difference_of_most_and_least_common(POLYMERS, times=40)}")
@@ -1,32 +1,27 @@
-import heapq
-
 from math import sqrt
+from typing import Iterator
+
+from common.file_input import LazyInput
+from common.grid import DIGITS, Grid, Point
+from common.search import bucket_search
 
-from common.file_input import read_multiline
-from common.grid import Grid, Point
+# risk levels are single digits
+MAX_RISK = 9
 
-def get_lowest_risk(grid: Grid[int]):
+def get_lowest_risk(grid: Grid[int]) -> int:
     grid_side_length = int(sqrt(len(grid)))
     start = (0, 0)
     end = (grid_side_length-1, grid_side_length-1)
-    smallest_cost = 10*len(grid)*len(grid)
-    heap_queue: list[tuple[int, Point, set[Point]]] = [(0, start, set())]
-    while heap_queue:
-        cost, point, seen = heapq.heappop(heap_queue)
-        if point in seen:
-            continue
-        if cost > smallest_cost:
-            continue
-        if point == end:
-            smallest_cost = cost
-            continue
-        seen.add(point)
-        neighbors = grid.get_neighbors(point, -1) # type: ignore
-        for neighbor, value in neighbors:
+
+    def get_risky_neighbors(point: Point) -> Iterator[tuple[int, Point]]:
+        for neighbor, value in grid.get_neighbors(point, -1): # type: ignore
             if value != -1:
-                heapq.heappush(heap_queue, (cost + value, # type:ignore
-                                            neighbor, seen))
-    return smallest_cost
+                yield value, neighbor
+
+    result = bucket_search(start, get_risky_neighbors,
+                           lambda point: point == end, MAX_RISK)
+    assert result.cost is not None, "The end should be reachable"
+    return result.cost
 
 def get_lowest_risk_big_grid(grid: Grid[int]) -> int:
     grid_side_length = int(sqrt(len(grid)))
@@ -43,8 +38,16 @@ def get_lowest_risk_big_grid(grid: Grid[int]) -> int:
     return get_lowest_risk(new_grid)
 
 
-GRID: Grid[int] = Grid(read_multiline('input/input15.txt'), int)
+INPUT: LazyInput[Grid[int]] = LazyInput(
+    'input/input15.txt', lambda f: Grid.from_file(f, DIGITS))
+__getattr__ = INPUT.as_attribute("GRID")
+
+PARTS = (get_lowest_risk, get_lowest_risk_big_grid)
+
+def solve(path: str) -> tuple:
+    return INPUT.solve(path, PARTS)
 
 if __name__ == "__main__":
+    GRID = INPUT.get()
     print(f"Lowest Risk Value: {get_lowest_risk(GRID)}")
     print(f"Lowest Risk Value (big grid): {get_lowest_risk_big_grid(GRID)}")
@@ -3,6 +3,8 @@ from dataclasses import dataclass
 from functools import reduce
 from typing import Callable, Generator, Iterator
 
+from common.file_input import LazyInput
+
 HEX_TO_BITS = {
     '0': '0000',
     '1': '0001',
@@ -72,11 +74,10 @@ class LiteralValuePacket(Packet):
 
 @dataclass
 class OperatorPacket(Packet):
-    func: Callable
 
     def get_value(self) -> int:
         values = [p.get_value() for p in self.subpackets]
-        return self.func(*values)
+        return FUNC_LOOKUP[self.typeId](*values)
 
 def parse_packet(text_iter: Iterator) -> Packet:
     version = int(read_bits(text_iter, 3), base=2)
@@ -120,8 +121,8 @@ def parse_operator_packet(version: int, typeId: int,
             # this is okay, we just have no more bits to read
             pass
 
-    func = FUNC_LOOKUP[typeId]
-    return OperatorPacket(version, typeId, sub_packets, func)
+    assert typeId in FUNC_LOOKUP
+    return OperatorPacket(version, typeId, sub_packets)
 
 def to_packet(text: str) -> Packet:
     bits = replace_hex_with_bits(text)
@@ -134,8 +135,19 @@ def to_packet(text: str) -> Packet:
 def get_version_numbers(packet: Packet):
     return sum(p.version for p in packet.visit())
 
-with open("input/input16.txt", encoding="utf-8") as f:
-    PACKET = to_packet(f.read().strip())
+def read_packet(filename: str) -> Packet:
+    with open(filename, encoding="utf-8") as f:
+        return to_packet(f.read().strip())
+
+INPUT = LazyInput("input/input16.txt", read_packet)
+__getattr__ = INPUT.as_attribute("PACKET")
+
+PARTS = (get_version_numbers, lambda packet: packet.get_value())
+
+def solve(path: str) -> tuple:
+    return INPUT.solve(path, PARTS)
+
 if __name__ == "__main__":
+    PACKET = INPUT.get()
     print(f"All version numbers: {get_version_numbers(PACKET)}")
     print(f"All version numbers: {PACKET.get_value()}")
@@ -4,6 +4,8 @@ import re
 from functools import lru_cache
 from typing import Generator
 
+from common.file_input import LazyInput
+
 Target = tuple[int, int, int, int]
 def to_target(text: str) -> Target:
     parts = re.split(r'(?:target area: x=)|(?:\.\.)|(?:, y=)', text)
@@ -44,9 +46,19 @@ def get_first_x_value(target: Target) -> int:
     return next(i for i,sum in accumulator() if sum >= target[0])
 
 
-with open("input/input17.txt", encoding="utf-8") as f:
-    TARGET = to_target(f.read().strip())
+def read_target(filename: str) -> Target:
+    with open(filename, encoding="utf-8") as f:
+        return to_target(f.read().strip())
+
+INPUT = LazyInput("input/input17.txt", read_target)
+__getattr__ = INPUT.as_attribute("TARGET")
+
+PARTS = (get_highest_y, get_total_number_of_shots)
+
+def solve(path: str) -> tuple:
+    return INPUT.solve(path, PARTS)
 
 if __name__ == "__main__":
+    TARGET = INPUT.get()
     print(f"Highest y: {get_highest_y(TARGET)}")
     print(f"Possible Values: {get_total_number_of_shots(TARGET)}")
@@ -6,7 +6,8 @@ import operator
 from copy import deepcopy
 from typing import Iterator, Optional, Union
 
-from common.file_input import read_multiline
+from common.file_input import LazyInput, read_multiline
+from common.instrument import instrument
 
 SnailfishNode = Union[int, 'Snailfish']
 class Snailfish:
@@ -68,6 +69,7 @@ class Snailfish:
                 self.right.apply_to_node_to_the_right(value)
 
 
+    @instrument
     def _reduce(self) -> bool:
         reduced = self.reduce_explode()
         if not reduced:
@@ -212,7 +214,16 @@ def get_largest_magnitude(snailfish: list[Snailfish]) -> int:
     return max((s1+s2).get_magnitude() for s1, s2 in pairs if s1 != s2)
 
 
-SNAILFISH = read_multiline("input/input18.txt", to_snailfish)
+INPUT: LazyInput[list[Snailfish]] = LazyInput(
+    "input/input18.txt", lambda f: read_multiline(f, to_snailfish))
+__getattr__ = INPUT.as_attribute("SNAILFISH")
+
+PARTS = (get_magnitude, get_largest_magnitude)
+
+def solve(path: str) -> tuple:
+    return INPUT.solve(path, PARTS)
+
 if __name__ == "__main__":
+    SNAILFISH = INPUT.get()
     print(f"Magnitude of fish: {get_magnitude(SNAILFISH)}")
     print(f"Largest magnitude: {get_largest_magnitude(SNAILFISH)}")
@@ -4,6 +4,9 @@ import re
 from dataclasses import dataclass
 from functools import lru_cache
 
+from common.file_input import LazyInput
+from common.instrument import instrument
+
 def get_rotations() -> list[tuple[int,int,int]]:
     rotations = []
     for orientation in ORIENTATIONS:
@@ -57,6 +60,7 @@ class Scanner:
     position: Point
     beacons_in_range: set[Point]
 
+    @instrument
     def get_adjacent_scanner_options(self,
                                      orientation: ScannerReading
                                      ) -> list['Scanner']:
@@ -118,6 +122,11 @@ def find_solved_scanners(readings: list[ScannerReading]) -> list[Scanner]:
     origin = at_origin(readings[0])
     return deduce([origin], readings[1:], len(readings))
 
+# both parts need the solved scanners, which is the slow bit
+@lru_cache(maxsize=1)
+def get_solved_scanners(readings: tuple[ScannerReading, ...]) -> list[Scanner]:
+    return find_solved_scanners(list(readings))
+
 def find_number_of_beacons(scanners: list[Scanner]) -> int:
     return len(set(itertools.chain.from_iterable(s.beacons_in_range
                                                  for s in scanners)))
@@ -155,11 +164,24 @@ def at_origin(scanner_reading: ScannerReading) -> Scanner:
     return Scanner((0,0,0), set(scanner_reading.beacons))
 
 
-with open("input/input19.txt", encoding="utf-8") as f:
-    SCANNER_READINGS = [to_scanner_reading(sr.split('\n'))
-                        for sr in f.read().split('\n\n')]
+def read_scanner_readings(filename: str) -> list[ScannerReading]:
+    with open(filename, encoding="utf-8") as f:
+        return [to_scanner_reading(sr.split('\n'))
+                for sr in f.read().split('\n\n')]
+
+INPUT = LazyInput("input/input19.txt", read_scanner_readings)
+__getattr__ = INPUT.as_attribute("SCANNER_READINGS")
+
+PARTS = (lambda readings: find_number_of_beacons(
+             get_solved_scanners(tuple(readings))),
+         lambda readings: get_distance_of_furthest_apart_scanners(
+             get_solved_scanners(tuple(readings))))
+
+def solve(path: str) -> tuple:
+    return INPUT.solve(path, PARTS)
 
 if __name__ == "__main__":
+    SCANNER_READINGS = INPUT.get()
     solved_scanners = find_solved_scanners(SCANNER_READINGS)
     print(f"Number of beacons: {find_number_of_beacons(solved_scanners)}")
     print(f"Distance on furthest scanners: "
@@ -1,55 +1,96 @@
-from common.file_input import read_multiline
+import functools
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, NamedTuple, Optional
+
+from common.file_input import LazyInput, get_line_ranges
 
 Move = tuple[str, int]
-Position = tuple[int, int]
-ImprovedPosition = tuple[int, int, int]
+# files smaller than this are not worth starting processes for
+MIN_PARALLEL_SIZE = 1 << 24
+# bytes read at a time, which bounds each worker's memory
+CHUNK_SIZE = 1 << 23
+
+
+# what a run of moves does: how far forward it goes, how much it changes
+# the aim, and how much depth it adds when it starts at aim 0. Starting at
+# aim a adds a * forward to that, so runs can be combined in any grouping.
+# The aim is the depth of the first part
+class Transform(NamedTuple):
+    forward: int = 0
+    aim: int = 0
+    depth: int = 0
+
+    def then(self, other: 'Transform') -> 'Transform':
+        return Transform(self.forward + other.forward, self.aim + other.aim,
+                         self.depth + other.depth + self.aim * other.forward)
+
+
+def get_transform(moves: Iterable[Move]) -> Transform:
+    forward = aim = depth = 0
+    for command, amount in moves:
+        if command == 'forward':
+            forward += amount
+            depth += aim * amount
+        elif command == 'down':
+            aim += amount
+        elif command == 'up':
+            aim -= amount
+        else:
+            raise RuntimeError('Invalid Move')
+    return Transform(forward, aim, depth)
 
 
-def get_position_value(moves: list[Move]) -> int:
-    position = (0, 0)
-    for move in moves:
-        position = make_move(move, position)
-    return position[0] * position[1]
+# the moves between two byte offsets that fall on line boundaries, read in
+# one go and split into words rather than parsed line by line
+def get_chunk_transform(filename: str, byte_range: tuple[int, int]
+                        ) -> Transform:
+    start, stop = byte_range
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        words = f.read(stop - start).decode("utf-8").split()
+    assert len(words) % 2 == 0, "Move without an amount"
+    return get_transform(zip(words[::2], map(int, words[1::2])))
 
 
-def make_move(move: Move, position: Position) -> Position:
-    if move[0] == 'forward':
-        return (position[0] + move[1], position[1])
-    if move[0] == 'down':
-        return (position[0], position[1] + move[1])
-    if move[0] == 'up':
-        return (position[0], position[1] - move[1])
-    raise RuntimeError('Invalid Move')
+# the file is cut into line aligned chunks that are turned into transforms,
+# by a pool of processes when it is big enough, and combined in order
+def get_file_transform(filename: str, jobs: Optional[int] = None
+                       ) -> Transform:
+    size = os.path.getsize(filename)
+    ranges = get_line_ranges(filename, max(1, size // CHUNK_SIZE))
+    get_chunk = functools.partial(get_chunk_transform, filename)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or size < MIN_PARALLEL_SIZE:
+        transforms = list(map(get_chunk, ranges))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            transforms = list(executor.map(get_chunk, ranges))
+    return functools.reduce(Transform.then, transforms, Transform())
 
 
-def get_improved_position_value(moves: list[Move]) -> int:
-    position = (0, 0, 0)
-    for move in moves:
-        position = make_improved_move(move, position)
-    return position[0] * position[1]
+def get_position_value(transform: Transform) -> int:
+    return transform.forward * transform.aim
 
 
-def make_improved_move(move: Move,
-                       position: ImprovedPosition) -> ImprovedPosition:
-    if move[0] == 'forward':
-        return (position[0] + move[1], position[1] + (move[1] * position[2]),
-                position[2])
-    if move[0] == 'down':
-        return (position[0], position[1], position[2] + move[1])
-    if move[0] == 'up':
-        return (position[0], position[1], position[2] - move[1])
-    raise RuntimeError('Invalid Move')
+def get_improved_position_value(transform: Transform) -> int:
+    return transform.forward * transform.depth
 
 
-def parse_move(text: str) -> Move:
-    values = text.split(' ')
-    assert values[0] in ['forward', 'down', 'up']
-    return (values[0], int(values[1]))
+# both parts only need the moves' transform, so that is what the input
+# parses to, chunked (and in parallel) whichever way the input is solved
+INPUT: LazyInput[Transform] = LazyInput("input/input2.txt", get_file_transform)
+__getattr__ = INPUT.as_attribute("TRANSFORM")
 
 
-MOVES: list[Move] = read_multiline("input/input2.txt", parse_move)
+PARTS = (get_position_value, get_improved_position_value)
 
+def solve(path: str) -> tuple:
+    return INPUT.solve(path, PARTS)
 
 if __name__ == "__main__":
-    print(f"Position value: {get_position_value(MOVES)}")
-    print(f"Position value (improved): {get_improved_position_value(MOVES)}")
+    TRANSFORM = INPUT.get()
+    print(f"Position value: {get_position_value(TRANSFORM)}")
+    print(f"Position value (improved): "
+          f"{get_improved_position_value(TRANSFORM)}")
@@ -1,43 +1,48 @@
-from common.grid import Grid, Point
+from common.automaton import Automaton, Rule
+from common.file_input import LazyInput
+from common.grid import DenseGrid
 
-ImageInfo = tuple[str, Grid[str]]
-def get_image_info(lines: list[str]) -> ImageInfo:
-    image_enhancement = lines[0]
-    grid: Grid[str] = Grid(lines[2:], lambda x: '1' if x=='#' else '0')
-    return (image_enhancement, grid)
+PIXELS = bytes.maketrans(b'.#', bytes([0, 1]))
+
+ImageInfo = tuple[bytes, DenseGrid]
+def get_image_info(data: bytes) -> ImageInfo:
+    image_enhancement, image = data.split(b'\n', 1)
+    return (image_enhancement.strip().translate(PIXELS),
+            DenseGrid.from_bytes(image, PIXELS))
 
 def get_number_of_pixels_lit(image_info: ImageInfo, steps=2) -> int:
-    enhancement, grid = image_info
-    for step in range(steps):
-        grid = enhance(enhancement, grid, step)
-    return list(grid.values()).count('1')
-
-def enhance(enhancement: str, grid: Grid[str], step: int) -> Grid[str]:
-    new_grid: Grid[str] = Grid([])
-    for point in grid:
-        new_grid[point] = get_new_value(enhancement, grid, point, step)
-
-    outskirts = grid.get_outskirt_points()
-    outskirt_values = [get_new_value(enhancement, grid, p, step)
-                       for p in outskirts]
-    if '1' in outskirt_values:
-        for p,v in zip(outskirts, outskirt_values):
-            new_grid[p] = v
-
-    return new_grid
-
-def get_new_value(enhancement: str, grid: Grid[str],
-                  point: Point, step: int) -> str:
-    #specific to input
-    default = '0' if step%2 == 0 else '1'
-    block = sorted(grid.get_neighbors(point, default, True) +
-                   [(point, grid.get(point, default))], key=lambda x:x[0][::-1])
-    index = int(''.join(b for _,b in block), base=2)
-    return '1' if enhancement[index]=='#' else '0'
-
-with open("input/input20.txt", encoding="utf-8") as f:
-    IMAGE_INFO = get_image_info([x.strip() for x in f.readlines()])
+    enhancement, image = image_info
+    # the image grows by a pixel each step, and the infinite dark (or lit)
+    # background beyond it is enhanced like any other pixel
+    automaton = Automaton(image, margin=steps, background_rule=lambda lit:
+                          enhancement[0b111111111 if lit else 0])
+    automaton.step_n([get_enhance_rule(enhancement, automaton)], steps)
+    return automaton.count(1)
+
+def get_enhance_rule(enhancement: bytes, automaton: Automaton) -> Rule:
+    a, b, c, d, e, f, g, h, i = automaton.window_offsets()
+    def enhance(cells: bytearray, index: int) -> int:
+        return enhancement[cells[index + a] << 8 | cells[index + b] << 7 |
+                           cells[index + c] << 6 | cells[index + d] << 5 |
+                           cells[index + e] << 4 | cells[index + f] << 3 |
+                           cells[index + g] << 2 | cells[index + h] << 1 |
+                           cells[index + i]]
+    return enhance
+
+def read_image_info(filename: str) -> ImageInfo:
+    with open(filename, 'rb') as f:
+        return get_image_info(f.read())
+
+INPUT = LazyInput("input/input20.txt", read_image_info)
+__getattr__ = INPUT.as_attribute("IMAGE_INFO")
+
+PARTS = (get_number_of_pixels_lit,
+         lambda image_info: get_number_of_pixels_lit(image_info, 50))
+
+def solve(path: str) -> tuple:
+    return INPUT.solve(path, PARTS)
 
 if __name__ == "__main__":
+    IMAGE_INFO = INPUT.get()
     print(f"Pixels lit: {get_number_of_pixels_lit(IMAGE_INFO)}")
     print(f"Pixels lit (50): {get_number_of_pixels_lit(IMAGE_INFO, 50)}")
@@ -155,6 +155,11 @@ def get_ways_to_roll(player1: Player, player2: Player,
                            not is_player1)
 
 
+# no input file, the starting positions are above
+PARTS = (lambda _: get_losing_score_x_dice_rolls(PLAYER1, PLAYER2),
+         lambda _: get_number_of_universes_won_by_predominant_player(PLAYER1,
+                                                                     PLAYER2))
+
 if __name__ == "__main__":
     print(f"Score x Dice: {get_losing_score_x_dice_rolls(PLAYER1, PLAYER2)}")
     universes_won = get_number_of_universes_won_by_predominant_player(PLAYER1,
@@ -4,7 +4,7 @@ import itertools
 from dataclasses import dataclass
 from typing import Iterator
 
-from common.file_input import read_multiline
+from common.file_input import LazyInput, read_multiline
 
 
 Point = tuple[int, int, int]
@@ -124,8 +124,9 @@ def to_cuboid_instruction(text: str) -> CuboidInstruction:
                                                       y_max, z_min, z_max))
 
 
-INSTRUCTIONS: list[CuboidInstruction] = read_multiline("input/input22.txt",
-                                                       to_cuboid_instruction)
+INPUT: LazyInput[list[CuboidInstruction]] = LazyInput(
+    "input/input22.txt", lambda f: read_multiline(f, to_cuboid_instruction))
+__getattr__ = INPUT.as_attribute("INSTRUCTIONS")
 INITIALIZATION_AREA = Cuboid(-50, 50, -50, 50, -50, 50)
 
 
@@ -181,7 +182,13 @@ def get_all_cubes_on(instructions: list[CuboidInstruction]) -> int:
                if is_on)
 
 
+PARTS = (get_cubes_on_in_initialization_area, get_all_cubes_on)
+
+def solve(path: str) -> tuple:
+    return INPUT.solve(path, PARTS)
+
 if __name__ == "__main__":
+    INSTRUCTIONS = INPUT.get()
     cubes_on = get_cubes_on_in_initialization_area(INSTRUCTIONS)
     print(f"Cubes On In Initialization Procedure Area: {cubes_on}")
     all_cubes_on = get_all_cubes_on(INSTRUCTIONS)
@@ -1,9 +1,9 @@
-import heapq
-
-from copy import deepcopy
 from dataclasses import dataclass
 
-from typing import Generator
+from typing import Generator, Iterator
+
+from common.instrument import instrument
+from common.search import a_star
 
 
 @dataclass(frozen=True)
@@ -28,7 +28,7 @@ class Room:
     def with_added_amphipod(self, amphipod: str) -> 'Room':
         assert self.can_fit(amphipod)
         next_spot = self.get_first_filled_spot() - 1
-        new_spots = deepcopy(self.spots)
+        new_spots = list(self.spots)
         new_spots[next_spot] = amphipod
 
         return Room(
@@ -40,7 +40,7 @@ class Room:
         assert self.get_occupant() == amphipod
 
         next_spot = self.get_first_filled_spot()
-        new_spots = deepcopy(self.spots)
+        new_spots = list(self.spots)
         new_spots[next_spot] = None
 
         return Room(
@@ -65,17 +65,16 @@ class Room:
 
 
 # this represents the current positioning
+# rooms are never changed in place (moves make new ones), so copying a
+# layout only needs a shallow copy of the list
 Spaces = list[str | Room | None]
 
 
-# just so we can heapify it
+# just so the search can keep track of it
 @dataclass(frozen=True)
 class Layout:
     spaces: Spaces
 
-    def __lt__(self, rhs: 'Layout'):
-        return str(self) < str(rhs)
-
     def __hash__(self) -> int:
         return hash(str(self))
 
@@ -128,7 +127,7 @@ def move_amphipod_to_room(spaces: Spaces,
     room = spaces[to_space]
     assert isinstance(room, Room) and room.can_fit(amphipod)
 
-    new_layout = deepcopy(spaces)
+    new_layout = list(spaces)
     new_layout[from_space] = None
     entry_cost = room.entry_cost()
     new_layout[to_space] = room.with_added_amphipod(amphipod)
@@ -143,7 +142,7 @@ def move_amphipod_from_room(spaces: Spaces,
     room = spaces[from_space]
     assert isinstance(room, Room)
 
-    new_layout = deepcopy(spaces)
+    new_layout = list(spaces)
     new_layout[to_space] = amphipod
     exit_cost = room.exit_cost()
     new_layout[from_space] = room.with_removed_amphipod(amphipod)
@@ -187,6 +186,7 @@ def move_to_hallway(spaces: Spaces, index: int,
 
 
 # get the solution space for possible moves
+@instrument
 def get_possible_moves(spaces: Spaces) -> Generator[tuple[int, Spaces],
                                                     None, None]:
     for index, space in enumerate(spaces):
@@ -201,21 +201,46 @@ def get_possible_moves(spaces: Spaces) -> Generator[tuple[int, Spaces],
             yield from move_to_hallway(spaces, index, len(spaces) - 1, 1)
 
 
+def get_next_layouts(layout: Layout) -> Iterator[tuple[int, Layout]]:
+    for cost, spaces in get_possible_moves(layout.spaces):
+        yield cost, Layout(spaces)
+
+
+# a lower bound on the energy left: every amphipod walks straight to its own
+# room, ignoring whoever is in the way
+def estimate_energy(layout: Layout) -> int:
+    room_indexes = {space.tag: index for index, space
+                    in enumerate(layout.spaces) if isinstance(space, Room)}
+    energy = 0
+    for index, space in enumerate(layout.spaces):
+        if isinstance(space, str):
+            steps = abs(index - room_indexes[space]) + 1
+            energy += steps * COSTS[space]
+        elif isinstance(space, Room):
+            for depth, amphipod in enumerate(space.spots):
+                if amphipod is None:
+                    continue
+                if amphipod != space.tag:
+                    steps = depth + 1 + abs(index - room_indexes[amphipod]) + 1
+                elif any(s != space.tag for s in space.spots[depth + 1:]):
+                    # has to step out to let the ones below leave
+                    steps = depth + 1 + 2 + 1
+                else:
+                    continue
+                energy += steps * COSTS[amphipod]
+    return energy
+
+
 def get_minimum_energy(spaces: Spaces) -> int:
-    states = [(0, Layout(spaces))]
-    seen = set([states[0][1]])
-    while states:
-        cost, candidate = heapq.heappop(states)
-        if is_complete(candidate.spaces):
-            return cost
-        for new_cost, new_spaces in get_possible_moves(candidate.spaces):
-            layout = Layout(new_spaces)
-            if layout in seen:
-                continue
-            seen.add(layout)
-            heapq.heappush(states, (cost + new_cost, layout))
-    assert False, "Should never reach here"
+    result = a_star(Layout(spaces), get_next_layouts,
+                    lambda layout: is_complete(layout.spaces), estimate_energy)
+    assert result.cost is not None, "Should never reach here"
+    return result.cost
+
 
+# no input file, the layouts are above
+PARTS = (lambda _: get_minimum_energy(SPACES),
+         lambda _: get_minimum_energy(BIG_SPACES))
 
 if __name__ == "__main__":
     print(f"Minimum energy: {get_minimum_energy(SPACES)}")
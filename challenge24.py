@@ -2,7 +2,7 @@ import functools
 
 from dataclasses import dataclass
 
-from common.file_input import read_multiline
+from common.file_input import LazyInput, read_multiline
 
 @dataclass
 class Instruction:
@@ -23,54 +23,87 @@ def to_instruction(text: str) -> Instruction:
     assert split[0] in ["inp", "add", "mul", "div", "mod", "eql"]
     return Instruction(split[0], split[1], operand)
 
+# z_divides, initial_xes and y_adds, one entry per digit
+Tables = tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...]]
+
 #  gathered from computer program
-z_divides = [1, 1, 1, 1, 26, 26, 26, 1, 1, 26, 26, 26, 1, 26]
-initial_xes = [13, 15, 15, 11, -16, -11, -6, 11, 10, -10, -8, -11, 12, -15]
-y_adds = [5, 14, 15, 16, 8, 9, 2, 13, 16, 6, 6, 9, 11, 5]
+z_divides = (1, 1, 1, 1, 26, 26, 26, 1, 1, 26, 26, 26, 1, 26)
+initial_xes = (13, 15, 15, 11, -16, -11, -6, 11, 10, -10, -8, -11, 12, -15)
+y_adds = (5, 14, 15, 16, 8, 9, 2, 13, 16, 6, 6, 9, 11, 5)
+TABLES: Tables = (z_divides, initial_xes, y_adds)
 
 assert len(z_divides) == len(initial_xes) == len(y_adds) == 14
 
+# every digit is read by the same block of instructions, which only differ
+# in the operands of "div z", "add x" and the second to last "add y"
+BLOCK_LENGTH = 18
+TABLE_LINES = (4, 5, 15)
+
+
+def get_tables(instructions: list[Instruction]) -> Tables:
+    blocks = [instructions[i:i + BLOCK_LENGTH]
+              for i in range(0, len(instructions), BLOCK_LENGTH)]
+    assert all(block[0].op == "inp" for block in blocks)
+    tables = tuple(tuple(block[line].operand for block in blocks)
+                   for line in TABLE_LINES)
+    assert all(isinstance(n, int) for table in tables for n in table)
+    return tables # type: ignore
+
 
 # z = z// Zi
 # if z%26 + Xi == Di:
 #    z = z*26 + Di + Yi
 
 
-def reduction(counter: int, z: int) -> list[int]:
+def reduction(counter: int, z: int, tables: Tables = TABLES
+              ) -> list[int]:
+    divides, xes, adds = tables
     if counter == -1:
         return [0]
     possible_digits: list[str] = []
     for possible_digit in range(9, 0, -1):
         # checking if z%26 + Xi can == Di
-        target_z = range(z * z_divides[counter],
-                         (z + 1) * z_divides[counter])
+        target_z = range(z * divides[counter],
+                         (z + 1) * divides[counter])
         for previous_z in target_z:
-            if previous_z % 26 + initial_xes[counter] == possible_digit:
+            if previous_z % 26 + xes[counter] == possible_digit:
                 possible_digits.extend([
-                    possible_digit * int(pow(10, len(y_adds) - counter - 1)) + s
-                    for s in reduction(counter - 1, previous_z)
+                    possible_digit * int(pow(10, len(adds) - counter - 1)) + s
+                    for s in reduction(counter - 1, previous_z, tables)
                 ])
 
-        candidate = (z - possible_digit - y_adds[counter]) // 26
-        target_z = range(candidate * z_divides[counter],
-                         (candidate + 1) * z_divides[counter])
+        candidate = (z - possible_digit - adds[counter]) // 26
+        target_z = range(candidate * divides[counter],
+                         (candidate + 1) * divides[counter])
         for previous_z in target_z:
             # make sure that we are in the else clause, and that
             # the digit is possible
-            if ((z == (previous_z // z_divides[counter] * 26
-                       + possible_digit + y_adds[counter])) and
-                    previous_z % 26 + initial_xes[counter] != possible_digit):
+            if ((z == (previous_z // divides[counter] * 26
+                       + possible_digit + adds[counter])) and
+                    previous_z % 26 + xes[counter] != possible_digit):
                 possible_digits.extend([
-                    possible_digit * int(pow(10, len(y_adds) - counter - 1)) + s
-                    for s in reduction(counter - 1, previous_z)
+                    possible_digit * int(pow(10, len(adds) - counter - 1)) + s
+                    for s in reduction(counter - 1, previous_z, tables)
                 ])
     return possible_digits
 
 
-INSTRUCTIONS: list[Instruction] = read_multiline("input/input24.txt",
-                                                 to_instruction)
+@functools.cache
+def get_valid_numbers(tables: Tables = TABLES) -> list[int]:
+    return reduction(len(tables[0]) - 1, 0, tables)
+
+
+INPUT: LazyInput[list[Instruction]] = LazyInput(
+    "input/input24.txt", lambda f: read_multiline(f, to_instruction))
+__getattr__ = INPUT.as_attribute("INSTRUCTIONS")
+
+PARTS = (lambda instructions: max(get_valid_numbers(get_tables(instructions))),
+         lambda instructions: min(get_valid_numbers(get_tables(instructions))))
+
+def solve(path: str) -> tuple:
+    return INPUT.solve(path, PARTS)
 
 if __name__ == "__main__":
-    values = reduction(len(initial_xes) - 1, 0)
+    values = get_valid_numbers(get_tables(INPUT.get()))
     print(f"Max valid number = {max(values)}")
     print(f"Min valid number = {min(values)}")
@@ -1,45 +1,54 @@
-import copy
 import itertools
 
-from common.file_input import read_multiline
-from common.grid import Grid, Point
-
-def get_right_point(point: Point, max_x) -> Point:
-    return ((point[0] + 1) % (max_x + 1), point[1])
-
-def get_lower_point(point: Point, max_y) -> Point:
-    return (point[0], (point[1] + 1) % (max_y + 1))
-
-def get_turns_until_stasis(cucumbers: Grid[str]) -> int:
-    points = {p: s for p, s in cucumbers.items() if s != '.'}
-
-    max_x = cucumbers.get_max_x(0)
-    max_y = cucumbers.get_max_y(0)
-
+from common.automaton import Automaton, BoardRule
+from common.file_input import LazyInput
+from common.grid import DenseGrid
+
+EAST, SOUTH, EMPTY = b'>v.'
+
+# 1 where the cell holds the symbol, 0 everywhere else
+def get_mask_table(symbol: int) -> bytes:
+    return bytes(int(value == symbol) for value in range(256))
+
+EMPTY_MASK = get_mask_table(EMPTY)
+
+def get_herd_rule(symbol: int, step: int) -> BoardRule:
+    herd_mask = get_mask_table(symbol)
+    shift = 8 * step
+    # the board is read as one big endian int with a byte per cell, so
+    # shifting right by a step lines each cell up with the one after it.
+    # The masks hold a 0 or 1 per byte, so adding them up never carries
+    def move(cells: bytearray) -> bytes:
+        herd = int.from_bytes(cells.translate(herd_mask), 'big')
+        empty = int.from_bytes(cells.translate(EMPTY_MASK), 'big')
+        # a free spot is taken by the cucumber behind it, which leaves
+        arrivals = empty & (herd >> shift)
+        departures = arrivals << shift
+        board = int.from_bytes(cells, 'big') + \
+            (arrivals - departures) * (symbol - EMPTY)
+        return board.to_bytes(len(cells), 'big')
+    return move
+
+def get_turns_until_stasis(cucumbers: DenseGrid) -> int:
+    # the herds wrap around the edges
+    automaton = Automaton(cucumbers, wrap=True)
+    rules = [get_herd_rule(EAST, automaton.offset(1, 0)),
+             get_herd_rule(SOUTH, automaton.offset(0, 1))]
     for turn in itertools.count(1):
-        moved = False
-        old_state = copy.deepcopy(points)
-        for point, symbol in old_state.items():
-            next_point = get_right_point(point, max_x)
-            if symbol == '>' and next_point not in old_state:
-                del points[point]
-                points[next_point] = '>'
-                moved = True
-
-        older_state = copy.deepcopy(points)
-        for point, symbol in old_state.items():
-            next_point = get_lower_point(point, max_y)
-            if symbol == 'v' and next_point not in older_state:
-                del points[point]
-                points[next_point] = 'v'
-                moved = True
-
-        if not moved:
+        moved = [automaton.apply_board(rule) for rule in rules]
+        if not any(moved):
             return turn
+    raise RuntimeError("Should never get here")
+
+INPUT: LazyInput[DenseGrid] = LazyInput(
+    "input/input25.txt", lambda f: DenseGrid.from_file(f, None))
+__getattr__ = INPUT.as_attribute("CUCUMBERS")
 
-    assert False, "Can not reach here"
+PARTS = (get_turns_until_stasis,)
 
-CUCUMBERS = Grid(read_multiline("input/input25.txt"))
+def solve(path: str) -> tuple:
+    return INPUT.solve(path, PARTS)
 
 if __name__ == "__main__":
+    CUCUMBERS = INPUT.get()
     print(f"Turns until stasis: {get_turns_until_stasis(CUCUMBERS)}")
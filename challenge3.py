@@ -1,37 +1,93 @@
-from common.file_input import read_multiline
+import bisect
 
-def get_power_rate(numbers: list[str]) -> int:
-    bitgroups = zip(*numbers)
-    gamma_bitstring = [get_most_common_bit(b) for b in bitgroups]
-    gamma_rate = int(''.join(gamma_bitstring), base=2)
-    # this is a bit of cheat since we know its 12 bits long
-    return gamma_rate * (~gamma_rate & 0xFFF)
+from dataclasses import dataclass
 
-def get_most_common_bit(bits: tuple[str, ...], inverse=False) -> str:
-    if len(bits) == 1:
-        return bits[0]
-    if inverse:
-        return '0' if bits.count('1') >= bits.count('0') else '1'
-    return '1' if bits.count('1') >= bits.count('0') else '0'
+from common.file_input import LazyInput
 
-def get_life_support_rating(numbers: list[str]) -> int:
-    return (get_oxygen_generator_rating(numbers) *
-            get_co2_scrubber_rating(numbers))
+# the report parsed once: how many numbers have a 1 in each column (from
+# the most significant bit down), and the numbers as sorted integers. The
+# numbers that share their first few bits are next to each other, and
+# within them the ones with a 0 as the following bit come before the ones
+# with a 1, so a bisect finds how many of each there are
+@dataclass(frozen=True)
+class Report:
+    width: int
+    ones: list[int]
+    values: list[int]
 
-def get_oxygen_generator_rating(numbers: list[str]) -> int:
-    return int(filter_numbers(numbers), base=2)
+# digits below which importing numpy costs more than it saves
+NUMPY_MIN_DIGITS = 1 << 20
 
-def get_co2_scrubber_rating(numbers: list[str]) -> int:
-    return int(filter_numbers(numbers, inverse=True), base=2)
+def to_report(numbers: list[str]) -> Report:
+    width = len(numbers[0])
+    assert all(len(n) == width for n in numbers), "Numbers of mixed widths"
+    return Report(width, count_ones(''.join(numbers), width),
+                  sorted(int(n, base=2) for n in numbers))
 
-def filter_numbers(numbers: list[str], inverse=False) -> str:
-    for index in range(len(numbers[0])):
-        bits = tuple(n[index] for n in numbers)
-        numbers = [n for n in numbers if n[index] == get_most_common_bit(bits, inverse=inverse)]
-    return numbers[0]
+# every width-th digit of the joined numbers is one column. Slicing those
+# out jumps all over memory for wide numbers, so big reports are summed as
+# a numpy matrix when it is installed
+def count_ones(joined: str, width: int) -> list[int]:
+    if len(joined) >= NUMPY_MIN_DIGITS:
+        try:
+            import numpy as np # pylint: disable=import-outside-toplevel
+        except ImportError:
+            pass
+        else:
+            digits = np.frombuffer(joined.encode("ascii"), np.uint8)
+            return np.count_nonzero(digits.reshape(-1, width) == ord('1'),
+                                    axis=0).tolist()
+    return [joined[i::width].count('1') for i in range(width)]
 
-NUMBERS = read_multiline("input/input3.txt")
+def read_report(filename: str) -> Report:
+    with open(filename, encoding="utf-8") as f:
+        return to_report(f.read().split())
+
+def get_power_rate(report: Report) -> int:
+    gamma_rate = 0
+    for ones in report.ones:
+        # ties go to 1
+        gamma_rate = gamma_rate << 1 | (ones * 2 >= len(report.values))
+    return gamma_rate * (~gamma_rate & ((1 << report.width) - 1))
+
+def get_life_support_rating(report: Report) -> int:
+    return find_rating(report) * find_rating(report, inverse=True)
+
+def get_oxygen_generator_rating(report: Report) -> int:
+    return find_rating(report)
+
+def get_co2_scrubber_rating(report: Report) -> int:
+    return find_rating(report, inverse=True)
+
+# narrows the candidates, values[low:high], down one bit at a time
+def find_rating(report: Report, inverse=False) -> int:
+    values = report.values
+    low, high = 0, len(values)
+    prefix = 0
+    for bit in reversed(range(report.width)):
+        if high - low == 1:
+            break
+        one = prefix | (1 << bit)
+        split = bisect.bisect_left(values, one, low, high)
+        ones, zeros = high - split, split - low
+        # a bit that every candidate shares keeps all of them
+        keep_ones = zeros == 0 or \
+            (ones != 0 and (ones >= zeros) != inverse)
+        if keep_ones:
+            low, prefix = split, one
+        else:
+            high = split
+    return values[low]
+
+INPUT: LazyInput[Report] = LazyInput("input/input3.txt", read_report)
+__getattr__ = INPUT.as_attribute("NUMBERS")
+
+PARTS = (get_power_rate, get_life_support_rating)
+
+def solve(path: str) -> tuple:
+    return INPUT.solve(path, PARTS)
 
 if __name__ == "__main__":
+    NUMBERS = INPUT.get()
     print(f"Power rate: {get_power_rate(NUMBERS)}")
     print(f"Life Support Rating: {get_life_support_rating(NUMBERS)}")
@@ -1,6 +1,11 @@
+import collections
+import itertools
+
 from collections import UserList
-from copy import deepcopy
-from typing import Optional
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from common.file_input import LazyInput
 
 # we'll use a bool to indicate marked
 class Row(UserList): # type: ignore
@@ -23,6 +28,12 @@ class Row(UserList): # type: ignore
     def mark(self, index: int):
         self.marked[index] = True
 
+    # the values never change, so only the marks are copied
+    def snapshot(self) -> 'Row':
+        row = Row(self.data)
+        row.marked = list(self.marked)
+        return row
+
 
 class Board:
 
@@ -49,21 +60,34 @@ class Board:
             except ValueError:
                 pass
 
+    def snapshot(self) -> 'Board':
+        return Board([row.snapshot() for row in self.rows])
+
 class Game:
 
     def __init__(self, moves: list[int], boards: list[Board]):
         self.moves = moves
         self.boards = boards
         self.last_move: int = 0
+        # moves are never removed, so snapshots can share the list
+        self.next_move_index = 0
 
     def get_winning_board(self) -> Optional[Board]:
         return next((b for b in self.boards if b.has_won()), None)
 
     def apply_next_move(self):
-        self.last_move = self.moves.pop(0)
+        self.last_move = self.moves[self.next_move_index]
+        self.next_move_index += 1
         for board in self.boards:
             board.apply_move(self.last_move)
 
+    # a copy that can be played on without touching this game
+    def snapshot(self) -> 'Game':
+        game = Game(self.moves, [board.snapshot() for board in self.boards])
+        game.last_move = self.last_move
+        game.next_move_index = self.next_move_index
+        return game
+
     def get_last_move_called(self) -> int:
         return self.last_move
 
@@ -83,22 +107,99 @@ def to_board(text: str) -> Board:
 def to_row(text: str) -> Row:
     return Row([int(n) for n in text.split(' ') if n])
 
+@dataclass(frozen=True)
+class Win:
+    # index into game.boards
+    board: int
+    # index into game.moves of the move that completed a row or column
+    turn: int
+    score: int
+
+
+SIZE = 5
+CELLS = SIZE * SIZE
+
+# plays the rest of the game without touching it, yielding boards in the
+# order they win (boards that win on the same move in board order)
+#
+# every number is looked up once in an index of the cells holding it, and
+# each board row and column keeps a count of its marks, so the whole game
+# costs O(cells + moves) however many boards there are
+def iter_wins(game: Game) -> Iterator[Win]:
+    unmarked, row_marks, column_marks, cells = index_game(game)
+    # boards that have already won are not reported again
+    won = bytearray(SIZE in row_marks[i:i + SIZE] or
+                    SIZE in column_marks[i:i + SIZE]
+                    for i in range(0, len(row_marks), SIZE))
+
+    for turn in range(game.next_move_index, len(game.moves)):
+        move = game.moves[turn]
+        winners = []
+        for cell in cells.pop(move, ()):
+            index = cell // CELLS
+            unmarked[index] -= move
+            row, column = cell // SIZE, index * SIZE + cell % SIZE
+            row_marks[row] += 1
+            column_marks[column] += 1
+            if not won[index] and \
+                    SIZE in (row_marks[row], column_marks[column]):
+                won[index] = True
+                winners.append(index)
+        # scored once the move has marked every cell it is on
+        for index in sorted(winners):
+            yield Win(index, turn, unmarked[index] * move)
+
+
+# every board's unmarked sum, the marks in each board row and column, and
+# the unmarked cells holding each number, where the boards' numbers are
+# laid out one after another so that a cell is
+#   board * CELLS + row * SIZE + column
+def index_game(game: Game) -> tuple[list[int], bytearray, bytearray,
+                                    dict[int, list[int]]]:
+    values = [value for board in game.boards for row in board.rows
+              for value in row.data]
+    marks = [marked for board in game.boards for row in board.rows
+             for marked in row.marked]
+    unmarked = [sum(values[i:i + CELLS]) for i in range(0, len(values), CELLS)]
+    row_marks = bytearray(len(values) // SIZE)
+    column_marks = bytearray(len(values) // SIZE)
+    cells: dict[int, list[int]] = collections.defaultdict(list)
+    for cell, value in enumerate(values):
+        if marks[cell]:
+            unmarked[cell // CELLS] -= value
+            row_marks[cell // SIZE] += 1
+            column_marks[cell // CELLS * SIZE + cell % SIZE] += 1
+        else:
+            cells[value].append(cell)
+    return unmarked, row_marks, column_marks, cells
+
+
+def get_ranked_board_score(game: Game, rank: int) -> int:
+    win = next(itertools.islice(iter_wins(game), rank, None), None)
+    if win is None:
+        raise ValueError(f"Fewer than {rank + 1} boards win")
+    return win.score
+
+
 def get_winning_board_score(game: Game) -> int:
-    while (winning_board := game.get_winning_board()) is None:
-        game.apply_next_move()
-    return winning_board.get_score() * game.get_last_move_called()
+    return get_ranked_board_score(game, 0)
 
 
 def get_losing_board_score(game: Game) -> int:
-    while len(remaining_boards := game.get_remaining_boards()) != 1:
-        game.apply_next_move()
-    remaining_board = remaining_boards[0]
+    last_wins = collections.deque(iter_wins(game), maxlen=1)
+    if not last_wins:
+        raise ValueError("No board wins")
+    return last_wins[0].score
+
+INPUT = LazyInput("input/input4.txt", read_game)
+__getattr__ = INPUT.as_attribute("GAME")
+
+PARTS = (get_winning_board_score, get_losing_board_score)
 
-    while not remaining_board.has_won():
-        game.apply_next_move()
-    return remaining_board.get_score() * game.get_last_move_called()
+def solve(path: str) -> tuple:
+    return INPUT.solve(path, PARTS)
 
-GAME = read_game("input/input4.txt")
 if __name__ == "__main__":
-    print(f"Winning board score {get_winning_board_score(deepcopy(GAME))}")
-    print(f"Losing board score {get_losing_board_score(deepcopy(GAME))}")
+    GAME = INPUT.get()
+    print(f"Winning board score {get_winning_board_score(GAME)}")
+    print(f"Losing board score {get_losing_board_score(GAME)}")
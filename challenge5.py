@@ -2,8 +2,9 @@ import itertools
 
 from collections import Counter
 from dataclasses import dataclass
+from typing import Iterable
 
-from common.file_input import read_multiline
+from common.file_input import LazyInput, read_multiline
 
 
 @dataclass(frozen=True)
@@ -55,22 +56,31 @@ def to_point(text: str) -> Point:
 
 
 def get_number_of_overlapping_points_no_diagonal(
-            lines: list[LineSegment]) -> int:
+            lines: Iterable[LineSegment]) -> int:
 
-    non_diagonal = [l for l in lines if l.is_vertical() or l.get_slope() == 0]
+    non_diagonal = (l for l in lines if l.is_vertical() or l.get_slope() == 0)
     return get_number_of_overlapping_points(non_diagonal)
 
 
-def get_number_of_overlapping_points(lines: list[LineSegment]) -> int:
+def get_number_of_overlapping_points(lines: Iterable[LineSegment]) -> int:
     all_points = itertools.chain.from_iterable(
         line.get_all_points() for line in lines)
     overlaps = Counter(all_points)
     return len([val for val, count in overlaps.items() if count >= 2])
 
 
-LINES = read_multiline("input/input5.txt", to_line)
+INPUT: LazyInput[list[LineSegment]] = LazyInput(
+    "input/input5.txt", lambda f: read_multiline(f, to_line))
+__getattr__ = INPUT.as_attribute("LINES")
+
+PARTS = (get_number_of_overlapping_points_no_diagonal,
+         get_number_of_overlapping_points)
+
+def solve(path: str) -> tuple:
+    return INPUT.solve(path, PARTS)
 
 if __name__ == "__main__":
+    LINES = INPUT.get()
     print(f"# of overlaps: "
           f"{get_number_of_overlapping_points_no_diagonal(LINES)}")
     print(f"# of overlaps (w/ diagonal): "
@@ -1,6 +1,6 @@
 from collections import Counter
 
-from common.file_input import read_single_line
+from common.file_input import LazyInput, read_single_line
 
 def get_lanternfish_after(fish: list[int], days: int) -> int:
     counter = Counter(fish)
@@ -19,9 +19,18 @@ def reproduce_fish(counter: Counter) -> Counter:
     return new_counter
 
 
-LANTERNFISH = read_single_line("input/input6.txt", func=int)
+INPUT: LazyInput[list[int]] = LazyInput(
+    "input/input6.txt", lambda f: read_single_line(f, func=int))
+__getattr__ = INPUT.as_attribute("LANTERNFISH")
+
+PARTS = (lambda fish: get_lanternfish_after(fish, days=80),
+         lambda fish: get_lanternfish_after(fish, days=256))
+
+def solve(path: str) -> tuple:
+    return INPUT.solve(path, PARTS)
 
 if __name__ == "__main__":
+    LANTERNFISH = INPUT.get()
     print(f"Lanternfish after 80 days: "
           f"{get_lanternfish_after(LANTERNFISH, days=80)}")
     print(f"Lanternfish after 256 days: "
@@ -1,4 +1,4 @@
-from common.file_input import read_single_line
+from common.file_input import LazyInput, read_single_line
 
 def get_fuel_spent(crabs: list[int], geometric=False) -> int:
     average_position = sum(crabs) // len(crabs)
@@ -21,8 +21,16 @@ def calculate_fuel_spent(crabs: list[int], pos: int, geometric=False) -> int:
     func = (lambda c: sum(range(1, abs(c - pos) + 1))) if geometric else (lambda c: abs(c - pos))
     return sum(func(c) for c in crabs)
 
-CRABS = read_single_line("input/input7.txt", func=int)
+INPUT: LazyInput[list[int]] = LazyInput(
+    "input/input7.txt", lambda f: read_single_line(f, func=int))
+__getattr__ = INPUT.as_attribute("CRABS")
+
+PARTS = (get_fuel_spent, lambda crabs: get_fuel_spent(crabs, True))
+
+def solve(path: str) -> tuple:
+    return INPUT.solve(path, PARTS)
 
 if __name__ == "__main__":
+    CRABS = INPUT.get()
     print(f"Fuel spent: {get_fuel_spent(CRABS)}")
     print(f"Fuel spent (geometric): {get_fuel_spent(CRABS, True)}")
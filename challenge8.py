@@ -1,7 +1,7 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, Optional
 
-from common.file_input import read_multiline
+from common.file_input import LazyInput, read_multiline
 
 
 DIGIT_SEGMENTS = ("abcefg", "cf", "acdeg", "acdfg", "bcdf", "abdfg",
@@ -19,7 +19,7 @@ def to_digital_display(text: str) -> DigitDisplay:
     return DigitDisplay(inputs.split(" "), outputs.split(" "))
 
 
-def get_number_of_easy_numbers(digit_displays: list[DigitDisplay]) -> int:
+def get_number_of_easy_numbers(digit_displays: Iterable[DigitDisplay]) -> int:
     return sum(len(get_easy_numbers(d.outputs)) for d in digit_displays)
 
 
@@ -27,7 +27,7 @@ def get_easy_numbers(outputs: list[str]):
     return [n for n in outputs if len(n) in (2, 3, 4, 7)]
 
 
-def get_decoded_sum(digit_displays: list[DigitDisplay]) -> int:
+def get_decoded_sum(digit_displays: Iterable[DigitDisplay]) -> int:
     return sum(decode(d) for d in digit_displays)
 
 
@@ -62,7 +62,16 @@ def deduce_solution(inputs: list[str],
     return None
 
 
-DIGIT_DISPLAYS = read_multiline("input/input8.txt", to_digital_display)
+INPUT: LazyInput[list[DigitDisplay]] = LazyInput(
+    "input/input8.txt", lambda f: read_multiline(f, to_digital_display))
+__getattr__ = INPUT.as_attribute("DIGIT_DISPLAYS")
+
+PARTS = (get_number_of_easy_numbers, get_decoded_sum)
+
+def solve(path: str) -> tuple:
+    return INPUT.solve(path, PARTS)
+
 if __name__ == "__main__":
+    DIGIT_DISPLAYS = INPUT.get()
     print(f"# of Easy Numbers: {get_number_of_easy_numbers(DIGIT_DISPLAYS)}")
     print(f"Decoded sum = {get_decoded_sum(DIGIT_DISPLAYS)}")
@@ -2,8 +2,8 @@
 from collections import Counter
 from typing import Optional
 
-from common.file_input import read_multiline
-from common.grid import Grid, Point
+from common.file_input import LazyInput
+from common.grid import DIGITS, Grid, Point
 
 
 def get_total_risk_level(grid: Grid) -> int:
@@ -47,8 +47,16 @@ def get_basin_sizes(grid: Grid) -> list[int]:
     return list(counter.values())
 
 
-GRID: Grid[str] = Grid(read_multiline("input/input9.txt"), func=int)
+INPUT: LazyInput[Grid[int]] = LazyInput(
+    "input/input9.txt", lambda f: Grid.from_file(f, DIGITS))
+__getattr__ = INPUT.as_attribute("GRID")
+
+PARTS = (get_total_risk_level, get_largest_basins_product)
+
+def solve(path: str) -> tuple:
+    return INPUT.solve(path, PARTS)
 
 if __name__ == "__main__":
+    GRID = INPUT.get()
     print(f"Total Risk Level: {get_total_risk_level(GRID)}")
     print(f"# largest basins sum {get_largest_basins_product(GRID)}")
@@ -0,0 +1,68 @@
+import pickle
+import sqlite3
+import time
+
+from typing import Any, Optional
+
+# Answers of solved parts in a SQLite file, so an unchanged solver is never
+# run twice on an unchanged input. An answer is keyed on its day and part,
+# a hash of the input file and a hash of the code that produced it, so
+# editing either one simply misses the old entry.
+#
+# once the stored answers outgrow the size limit, the least recently used
+# ones are dropped
+
+DEFAULT_FILENAME = ".answers.cache"
+MAX_SIZE = 1 << 20
+
+# day, part, input hash, code hash
+Key = tuple[int, int, str, str]
+
+
+class AnswerCache:
+
+    def __init__(self, filename: str = DEFAULT_FILENAME,
+                 max_size: int = MAX_SIZE):
+        self.max_size = max_size
+        self.connection = sqlite3.connect(filename)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS answers ("
+                "day INTEGER, part INTEGER, input TEXT, code TEXT, "
+                "answer BLOB, size INTEGER, used REAL, "
+                "PRIMARY KEY (day, part, input, code))")
+
+    def get(self, key: Key) -> Optional[Any]:
+        with self.connection:
+            row = self.connection.execute(
+                "SELECT answer FROM answers WHERE day = ? AND part = ? "
+                "AND input = ? AND code = ?", key).fetchone()
+            if row is None:
+                return None
+            self.connection.execute(
+                "UPDATE answers SET used = ? WHERE day = ? AND part = ? "
+                "AND input = ? AND code = ?", (time.time(), *key))
+        return pickle.loads(row[0])
+
+    def put(self, key: Key, answer: Any):
+        blob = pickle.dumps(answer, protocol=pickle.HIGHEST_PROTOCOL)
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (*key, blob, len(blob), time.time()))
+            self.evict()
+
+    def evict(self):
+        # keeps the most recently used answers that fit in max_size
+        self.connection.execute(
+            "DELETE FROM answers WHERE rowid IN ("
+            "SELECT rowid FROM (SELECT rowid, SUM(size) OVER "
+            "(ORDER BY used DESC, rowid DESC) AS total FROM answers) "
+            "WHERE total > ?)", (self.max_size,))
+
+    def __len__(self) -> int:
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM answers").fetchone()[0]
+
+    def close(self):
+        self.connection.close()
@@ -0,0 +1,172 @@
+import itertools
+
+from typing import Callable, Optional, Sequence
+
+from common.grid import DIGITS, DenseGrid
+
+# Synchronous cellular automata on a bytearray.
+#
+# The board sits inside a one cell halo, so every board cell has all eight
+# neighbors at fixed index offsets and rules never need bounds checks. The
+# halo either wraps around to the opposite edge (a torus) or holds the
+# background, the value of every cell beyond the board. A margin of
+# background cells can be added around the board for patterns that grow.
+#
+# A rule takes the current cells and a cell's index and returns the cell's
+# next value; every cell is updated from the same generation, with the new
+# values going into a second buffer that is then swapped with the first, so
+# the two buffers are reused rather than allocated every update. Rules that
+# only look at the cell itself can be given as a 256 byte translation table
+# instead, which updates the whole board in one C call. Rules that can be
+# written as a few operations over all of the cells at once can be given as
+# a board rule, which takes the cells (halo included) and returns the next.
+
+Rule = Callable[[bytearray, int], int]
+BoardRule = Callable[[bytearray], bytes]
+
+
+class Automaton:
+
+    def __init__(self, grid: DenseGrid, margin: int = 0, wrap: bool = False,
+                 background: int = 0,
+                 background_rule: Optional[Callable[[int], int]] = None):
+        assert not (wrap and margin), "A wrapping board can not grow"
+        self.width = grid.width + 2 * margin
+        height = grid.height + 2 * margin
+        self.wrap = wrap
+        self.background = background
+        # what the background turns into each generation (it stays put
+        # when not given)
+        self.background_rule = background_rule
+
+        size = self.stride * (height + 2)
+        # the current cells, then the buffer the next update is written to
+        self.buffers = [bytearray([background]) * size, bytearray(size)]
+        self.rows = [range(self.to_index((0, y)),
+                           self.to_index((0, y)) + self.width)
+                     for y in range(height)]
+        for y in range(grid.height):
+            start = self.rows[y + margin].start + margin
+            self.cells[start:start + grid.width] = \
+                grid.cells[y * grid.width:(y + 1) * grid.width]
+        self.generation = 0
+
+    @property
+    def cells(self) -> bytearray:
+        return self.buffers[0]
+
+    @property
+    def height(self) -> int:
+        return len(self.rows)
+
+    # distance between rows, including the halo on either side
+    @property
+    def stride(self) -> int:
+        return self.width + 2
+
+    def to_index(self, point: tuple[int, int]) -> int:
+        return (point[1] + 1) * self.stride + point[0] + 1
+
+    def offset(self, dx: int, dy: int) -> int:
+        return dy * self.stride + dx
+
+    # the 3x3 block around a cell in reading order
+    def window_offsets(self) -> tuple[int, ...]:
+        return tuple(self.offset(dx, dy) for dy in (-1, 0, 1)
+                     for dx in (-1, 0, 1))
+
+    def neighbor_offsets(self) -> tuple[int, ...]:
+        return tuple(o for o in self.window_offsets() if o)
+
+    def fill_halo(self):
+        cells, stride = self.cells, self.stride
+        first, last = self.rows[0], self.rows[-1]
+        if self.wrap:
+            for row in self.rows:
+                cells[row.start - 1] = cells[row.stop - 1]
+                cells[row.stop] = cells[row.start]
+            cells[first.start - stride - 1:first.stop - stride + 1] = \
+                cells[last.start - 1:last.stop + 1]
+            cells[last.start + stride - 1:last.stop + stride + 1] = \
+                cells[first.start - 1:first.stop + 1]
+        else:
+            background = self.background
+            for row in self.rows:
+                cells[row.start - 1] = cells[row.stop] = background
+            halo_row = bytes([background]) * self.stride
+            cells[:self.stride] = halo_row
+            cells[-self.stride:] = halo_row
+
+    # one synchronous update of every board cell, returning whether
+    # anything changed
+    def apply(self, rule: Rule) -> bool:
+        self.fill_halo()
+        cells, next_cells = self.buffers
+        # carries over the halo, copied in place
+        next_cells[:] = cells
+        for row in self.rows:
+            next_cells[row.start:row.stop] = bytes(
+                map(rule, itertools.repeat(cells, len(row)), row))
+        changed = next_cells != cells
+        self.buffers = [next_cells, cells]
+        if self.background_rule:
+            self.background = self.background_rule(self.background)
+        return changed
+
+    def apply_board(self, rule: BoardRule) -> bool:
+        self.fill_halo()
+        cells, next_cells = self.buffers
+        next_cells[:] = rule(cells)
+        self.buffers = [next_cells, cells]
+        if self.background_rule:
+            self.background = self.background_rule(self.background)
+        # the rule may leave junk in the halo, so that is refilled before
+        # looking for changes
+        self.fill_halo()
+        return next_cells != cells
+
+    def apply_table(self, table: bytes) -> bool:
+        cells = self.cells
+        self.buffers[0] = cells.translate(table)
+        if self.background_rule:
+            self.background = self.background_rule(self.background)
+        self.fill_halo()
+        return self.cells != cells
+
+    def apply_until_fixpoint(self, rule: Rule) -> int:
+        for applications in itertools.count(1):
+            if not self.apply(rule):
+                return applications
+        raise RuntimeError("Should never get here")
+
+    # a generation may take several rules, each its own synchronous update
+    def step(self, rules: Sequence[Rule]) -> bool:
+        changed = [self.apply(rule) for rule in rules]
+        self.generation += 1
+        return any(changed)
+
+    def step_n(self, rules: Sequence[Rule], steps: int):
+        for _ in range(steps):
+            self.step(rules)
+
+    # returns the generation that changed nothing
+    def step_until_fixpoint(self, rules: Sequence[Rule],
+                            limit: Optional[int] = None) -> int:
+        while self.step(rules):
+            if limit is not None and self.generation >= limit:
+                raise RuntimeError(f"No fixpoint after {limit} generations")
+        return self.generation
+
+    def count(self, value: int) -> int:
+        target = bytes([value])
+        return sum(self.cells.count(target, row.start, row.stop)
+                   for row in self.rows)
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+    # the table is what the cells were read with, for rendering
+    def to_dense_grid(self, table: Optional[bytes] = DIGITS[0]) -> DenseGrid:
+        return DenseGrid.from_cells(self.width, self.height, bytearray(
+            b''.join(self.cells[row.start:row.stop] for row in self.rows)),
+            table)
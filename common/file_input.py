@@ -1,12 +1,172 @@
+import functools
+import glob
+import hashlib
+import itertools
+import mmap
+import os
+import pickle
+import sys
+
+from typing import Any, Callable, Generic, Iterable, Iterator, Optional, \
+    Sequence, TypeVar
+
+T = TypeVar('T')
+
+
 def read_numbers(filename: str) -> list[int]:
-    with open(filename, encoding="utf-8") as f:
-        return [int(stripped) for l in f if (stripped:= l.strip())]
+    return list(iter_numbers(filename))
 
 
 def read_multiline(filename: str, func=lambda s: s) -> list:
-    with open(filename, encoding="utf-8") as f:
-        return [func(l.strip()) for l in f if l.strip() if l.strip()]
+    return list(iter_multiline(filename, func))
 
 def read_single_line(filename: str, delimiter=',', func=lambda s: s) -> list:
-    with open(filename, encoding="utf-8") as f:
-        return [func(l.strip()) for l in f.read().strip().split(delimiter)]
+    return list(iter_delimited(filename, delimiter, func))
+
+
+# the iter_* readers stream records out of a memory mapped file, so they run
+# in constant memory no matter how big the input is
+def iter_numbers(filename: str) -> Iterator[int]:
+    for line in _iter_records(filename, b'\n'):
+        if stripped := line.strip():
+            yield int(stripped)
+
+def iter_multiline(filename: str, func=lambda s: s) -> Iterator:
+    for line in _iter_records(filename, b'\n'):
+        if stripped := line.strip():
+            yield func(stripped.decode("utf-8"))
+
+def iter_delimited(filename: str, delimiter=',', func=lambda s: s) -> Iterator:
+    for record in _iter_records(filename, delimiter.encode("utf-8")):
+        if stripped := record.strip():
+            yield func(stripped.decode("utf-8"))
+
+def _iter_records(filename: str, separator: bytes) -> Iterator[bytes]:
+    with open(filename, 'rb') as f:
+        # mmap refuses to map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            start = 0
+            while (end := mapped.find(separator, start)) != -1:
+                yield mapped[start:end]
+                start = end + len(separator)
+            yield mapped[start:]
+
+
+# splits a file into about the given number of byte ranges, each of which
+# ends just after a newline so that no line is cut in two
+def get_line_ranges(filename: str, chunks: int) -> list[tuple[int, int]]:
+    size = os.path.getsize(filename)
+    offsets = [0]
+    with open(filename, 'rb') as f:
+        for chunk in range(1, chunks):
+            # from the byte before, so a cut that already falls at the start
+            # of a line stays there
+            f.seek(max(size * chunk // chunks - 1, offsets[-1]))
+            f.readline()
+            offsets.append(f.tell())
+    offsets.append(size)
+    return [(start, stop) for start, stop in itertools.pairwise(offsets)
+            if stop > start]
+
+
+# an input file and the parser that turns it into a puzzle input
+# nothing is read until the value is first asked for, and the parsed value
+# is kept for the rest of the process
+class LazyInput(Generic[T]):
+
+    def __init__(self, filename: str, parser: Callable[[str], T],
+                 cache: bool = True):
+        self.filename = filename
+        self.parser = parser
+        self.cache = cache
+        self.value: Optional[T] = None
+        self.loaded = False
+
+    def get(self) -> T:
+        if not self.loaded:
+            self.value = self.parse(self.filename)
+            self.loaded = True
+        return self.value # type: ignore
+
+    def parse(self, filename: str) -> T:
+        if self.cache:
+            return read_cached(filename, self.parser)
+        return self.parser(filename)
+
+    # solves some other file in the same format, leaving the declared input
+    # alone. Batch runs only see each file once, so the parse isn't cached
+    def solve(self, filename: str, parts: Sequence[Callable[[T], Any]]
+              ) -> tuple:
+        value = self.parser(filename)
+        return tuple(part(value) for part in parts)
+
+    # meant to be assigned to a module's __getattr__ so that the old
+    # module level constant (e.g. challenge1.MEASUREMENTS) still works
+    def as_attribute(self, name: str) -> Callable[[str], T]:
+        def get_attribute(attribute: str) -> T:
+            if attribute != name:
+                raise AttributeError(f"no attribute {attribute!r}")
+            return self.get()
+        return get_attribute
+
+
+COMMON_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+def hash_file(filename: str) -> str:
+    with open(filename, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+def hash_sources(filenames: Iterable[str]) -> str:
+    digest = hashlib.sha256()
+    for filename in filenames:
+        digest.update(hash_file(filename).encode("ascii"))
+    return digest.hexdigest()
+
+# a module's own source and everything in common/, which covers whatever
+# helpers its code might call (this file and its cache layout included)
+@functools.cache
+def get_code_hash(module_name: str) -> str:
+    common = sorted(glob.glob(os.path.join(COMMON_DIRECTORY, "*.py")))
+    filename = getattr(sys.modules.get(module_name), "__file__", None)
+    return hash_sources([filename, *common] if filename else common)
+
+def get_parser_identity(parser: Callable) -> str:
+    return (f"{parser.__module__}.{parser.__qualname__}:"
+            f"{get_code_hash(parser.__module__)}")
+
+def get_cache_filename(filename: str) -> str:
+    directory, name = os.path.split(filename)
+    return os.path.join(directory, f".{name}.cache")
+
+# parsed inputs are pickled next to the input file, keyed on the file's
+# content, the parser that produced them and the code it could have run.
+# Anything that can't be pickled or a stale/corrupt cache just falls back
+# to parsing the file
+def read_cached(filename: str, parser: Callable[[str], T]) -> T:
+    key = (hash_file(filename), get_parser_identity(parser))
+    cache_filename = get_cache_filename(filename)
+    try:
+        with open(cache_filename, 'rb') as f:
+            if pickle.load(f) == key:
+                return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError,
+            ImportError, IndexError, TypeError, ValueError):
+        pass
+
+    value = parser(filename)
+    _write_cache(cache_filename, key, value)
+    return value
+
+def _write_cache(cache_filename: str, key: tuple, value: Any):
+    temp_filename = f"{cache_filename}.{os.getpid()}"
+    try:
+        with open(temp_filename, 'wb') as f:
+            pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_filename, cache_filename)
+    except (OSError, pickle.PicklingError, AttributeError, TypeError,
+            RecursionError):
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
@@ -1,21 +1,34 @@
 
-import functools
 import itertools
 
 from collections import UserDict
-from typing import Callable, Generator, Generic, TypeVar
+from typing import (Callable, Generator, Generic, Iterator, Optional, TextIO,
+                    TypeVar)
+
+from common.instrument import instrument
 
 Point = tuple[int, int]
 
 T = TypeVar('T')
 
-@functools.lru_cache
-def get_neighboring_points(point: Point, diagonal=False):
+# decoders for from_bytes: a translation table for the raw bytes, and whether
+# the translated bytes are the cells as ints (or else as characters)
+Decoder = tuple[Optional[bytes], bool]
+DIGITS: Decoder = (bytes.maketrans(b'0123456789', bytes(range(10))), True)
+BITS: Decoder = (bytes(ord('1') if b == ord('#') else ord('0')
+                       for b in range(256)), False)
+SYMBOLS: Decoder = (None, False)
+
+# up, left, right, down, then the diagonals
+ADJACENT_OFFSETS = ((0, -1), (-1, 0), (1, 0), (0, 1))
+ALL_OFFSETS = ADJACENT_OFFSETS + ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+# not cached: a search visits each point about once, so a cache only ever
+# missed, and building the few tuples costs less than looking them up
+def get_neighboring_points(point: Point, diagonal=False) -> tuple[Point, ...]:
     x,y = point
-    points = [(x, y-1),(x-1, y), (x+1, y), (x, y+1)]
-    if diagonal:
-        points += [(x-1, y-1), (x-1, y+1), (x+1, y-1), (x+1, y+1)]
-    return points
+    offsets = ALL_OFFSETS if diagonal else ADJACENT_OFFSETS
+    return tuple((x + dx, y + dy) for dx, dy in offsets)
 
 
 class Grid(UserDict, Generic[T]):
@@ -24,49 +37,326 @@ class Grid(UserDict, Generic[T]):
         super().__init__()
         self.data: dict[Point, T] ={(x,y): func(lines[y][x])
                                     for x,y in _get_grid_points(lines)}
+        self.shared = False
+        self._recompute_bounds()
+
+    @classmethod
+    def from_dict(cls, data: dict[Point, T]) -> 'Grid[T]':
+        grid: Grid[T] = cls([])
+        grid.data = data
+        grid._recompute_bounds()
+        return grid
+
+    # builds the grid a row at a time, with the translation and dict
+    # building all done in C rather than a Python call per cell
+    @classmethod
+    def from_bytes(cls, data: bytes, decoder: Decoder = SYMBOLS) -> 'Grid':
+        table, as_ints = decoder
+        rows = [row for line in data.splitlines() if (row := line.strip())]
+        cells: dict = {}
+        row_lengths = []
+        for y, row in enumerate(rows):
+            translated = row.translate(table)
+            values = translated if as_ints else translated.decode("utf-8")
+            cells.update(zip(zip(range(len(values)), itertools.repeat(y)),
+                             values))
+            row_lengths.append(len(values))
+        grid: Grid = cls([])
+        grid.data = cells
+        grid._set_bounds_from_rows(row_lengths)
+        return grid
+
+    @classmethod
+    def from_file(cls, filename: str, decoder: Decoder = SYMBOLS) -> 'Grid':
+        with open(filename, 'rb') as f:
+            return cls.from_bytes(f.read(), decoder)
+
+    # bounds are kept up to date as points are added, so none of the queries
+    # below need to look at every point. Removing a point may shrink the
+    # bounds, so that just marks them to be recomputed on next use
+    def __setitem__(self, point: Point, value: T):
+        self._unshare()
+        if point not in self.data:
+            self._add_to_bounds(point)
+        self.data[point] = value
+
+    def __delitem__(self, point: Point):
+        self._unshare()
+        del self.data[point]
+        self.bounds_stale = True
+
+    # only the points get pickled (or deep copied), the bounds are rebuilt
+    def __getstate__(self) -> dict:
+        return {'data': self.data}
+
+    def __setstate__(self, state: dict):
+        self.data = state['data']
+        self.shared = False
+        self._recompute_bounds()
+
+    # a copy-on-write copy: the snapshot and this grid share their points
+    # until either one is written to, at which point the writer takes its
+    # own (shallow) copy. The values themselves are never copied
+    def snapshot(self) -> 'Grid[T]':
+        grid = type(self).__new__(type(self))
+        grid.__dict__.update(self.__dict__)
+        self.shared = grid.shared = True
+        return grid
+
+    def copy(self) -> 'Grid[T]':
+        return self.snapshot()
+
+    __copy__ = copy
+
+    # UserDict merges straight into self.data, which would skip both the
+    # copy-on-write and the bounds, so merges go through __setitem__
+    def __ior__(self, other) -> 'Grid[T]':
+        self.update(other)
+        return self
+
+    def __or__(self, other) -> 'Grid[T]':
+        grid = self.snapshot()
+        grid |= other
+        return grid
+
+    def _unshare(self):
+        if self.shared:
+            self.data = dict(self.data)
+            self.row_max_x = dict(self.row_max_x)
+            self.column_max_y = dict(self.column_max_y)
+            self.shared = False
+
+    def _recompute_bounds(self):
+        # min_x, min_y, max_x, max_y
+        self.bounds: Optional[tuple[int, int, int, int]] = None
+        self.row_max_x: dict[int, int] = {}
+        self.column_max_y: dict[int, int] = {}
+        self.bounds_stale = False
+        for point in self.data:
+            self._add_to_bounds(point)
+
+    # for grids laid out from (0, 0) a row at a time
+    def _set_bounds_from_rows(self, row_lengths: list[int]):
+        self.bounds = None
+        self.row_max_x = {y: length - 1 for y, length in enumerate(row_lengths)}
+        self.column_max_y = {}
+        self.bounds_stale = False
+        if row_lengths:
+            self.bounds = (0, 0, max(row_lengths) - 1, len(row_lengths) - 1)
+        for y in reversed(range(len(row_lengths))):
+            for x in range(len(self.column_max_y), row_lengths[y]):
+                self.column_max_y[x] = y
+
+    def _add_to_bounds(self, point: Point):
+        x, y = point
+        if self.bounds is None:
+            self.bounds = (x, y, x, y)
+        else:
+            min_x, min_y, max_x, max_y = self.bounds
+            if not (min_x <= x <= max_x and min_y <= y <= max_y):
+                self.bounds = (min(x, min_x), min(y, min_y),
+                               max(x, max_x), max(y, max_y))
+        if x > self.row_max_x.get(y, x - 1):
+            self.row_max_x[y] = x
+        if y > self.column_max_y.get(x, y - 1):
+            self.column_max_y[x] = y
+
+    # min_x, min_y, max_x, max_y
+    def get_bounds(self) -> tuple[int, int, int, int]:
+        if self.bounds_stale:
+            self._recompute_bounds()
+        assert self.bounds is not None, "Empty grid has no bounds"
+        return self.bounds
 
     # returns the neighbors a up, left, right, down
+    @instrument
     def get_neighbors(self, point: Point, default_value: T,
                       diagonal=False) -> list[tuple[Point, T]]:
         neighbor_points = get_neighboring_points(point, diagonal)
         return [(p, self.data.get(p, default_value)) for p in neighbor_points]
 
     def get_max_x(self, row_index: int) -> int:
-        return max(p[0] for p in self.data.keys() if p[1] == row_index)
+        if self.bounds_stale:
+            self._recompute_bounds()
+        return self.row_max_x[row_index]
 
     def get_max_y(self, col_index: int) -> int:
-        return max(p[1] for p in self.data.keys() if p[0] == col_index)
+        if self.bounds_stale:
+            self._recompute_bounds()
+        return self.column_max_y[col_index]
 
     # get points outside the gride
     def get_outskirt_points(self) -> list[Point]:
-        xes = {x for x,_ in self.data.keys()}
-        yes = {y for _,y in self.data.keys()}
-        min_x = min(xes)
-        max_x = max(xes)
-        min_y = min(yes)
-        max_y = max(yes)
-        borders = (list(itertools.product([min_x - 1, max_x + 1], yes)) + # type: ignore
+        min_x, min_y, max_x, max_y = self.get_bounds()
+        xes = range(min_x, max_x + 1)
+        yes = range(min_y, max_y + 1)
+        borders = (list(itertools.product([min_x - 1, max_x + 1], yes)) +
                    list(itertools.product(xes, [min_y - 1, max_y + 1])))
         corners = list(itertools.product([min_x - 1, max_x + 1],
                                          [min_y - 1, max_y + 1]))
         return borders + corners
 
-    def __str__(self) -> str:
-        xes = [x for x, _ in self.data.keys()]
-        yes = [y for _, y in self.data.keys()]
-        min_x = min(xes)
-        max_x = max(xes)
-        min_y = min(yes)
-        max_y = max(yes)
-        outstr: str = ''
+    # yields each row as a string, any point not in the grid is shown as empty
+    def iter_rows(self, empty: str = ' ') -> Iterator[str]:
+        min_x, min_y, max_x, max_y = self.get_bounds()
+        xes = range(min_x, max_x + 1)
         for y in range(min_y, max_y + 1):
-            for x in range(min_x, max_x + 1):
-                outstr += str(self.data.get((x, y), ' ')) # type: ignore
-            outstr += '\n'
-        return outstr
+            points = zip(xes, itertools.repeat(y))
+            yield ''.join(map(str, map(self.data.get, points,
+                                       itertools.repeat(empty))))
+
+    def render(self, out: TextIO, empty: str = ' '):
+        for row in self.iter_rows(empty):
+            out.write(row)
+            out.write('\n')
+
+    def __str__(self) -> str:
+        return ''.join(f"{row}\n" for row in self.iter_rows())
+
+
+# the inverse of a from_bytes translation table, so that each cell renders as
+# the one character it was read from. Values the table never produces (an
+# octopus charged past 9, say) render as '#'
+def get_render_table(table: Optional[bytes]) -> Optional[bytes]:
+    if table is None:
+        return None
+    render_table = bytearray(b'#' * 256)
+    for byte, value in enumerate(table):
+        if byte != value:
+            render_table[value] = byte
+    return bytes(render_table)
 
 
 def _get_grid_points(grid: list[str]) -> Generator[Point, None, None]:
     for row_index, row in enumerate(grid):
         for column_index, _ in enumerate(row):
             yield column_index,row_index
+
+
+# a grid of small ints (0-255) stored row by row in one flat bytearray.
+# It takes a byte per cell rather than a dict entry per cell, and cells can be
+# addressed by integer index (y * width + x) for hot loops
+class DenseGrid:
+
+    def __init__(self, lines: list[str], func: Callable[[str], int] = int):
+        self.height = len(lines)
+        self.width = len(lines[0]) if lines else 0
+        self.cells = bytearray(func(c) for line in lines for c in line)
+        assert len(self.cells) == self.width * self.height, "Rows must match"
+        # what the cells were translated with, used to render them
+        self.table: Optional[bytes] = DIGITS[0]
+        self.neighbor_table = self._build_neighbor_table()
+
+    @classmethod
+    def from_cells(cls, width: int, height: int, cells: bytearray,
+                   table: Optional[bytes] = DIGITS[0]) -> 'DenseGrid':
+        assert len(cells) == width * height
+        grid = cls([])
+        grid.width = width
+        grid.height = height
+        grid.cells = cells
+        grid.table = table
+        grid.neighbor_table = grid._build_neighbor_table()
+        return grid
+
+    @classmethod
+    def from_bytes(cls, data: bytes,
+                   table: Optional[bytes] = DIGITS[0]) -> 'DenseGrid':
+        rows = [row for line in data.splitlines() if (row := line.strip())]
+        width = len(rows[0]) if rows else 0
+        assert all(len(row) == width for row in rows), "Rows must match"
+        return cls.from_cells(width, len(rows),
+                              bytearray(b''.join(rows).translate(table)), table)
+
+    @classmethod
+    def from_file(cls, filename: str,
+                  table: Optional[bytes] = DIGITS[0]) -> 'DenseGrid':
+        with open(filename, 'rb') as f:
+            return cls.from_bytes(f.read(), table)
+
+    # hot loops write to cells directly, so rather than copy-on-write this
+    # is a straight memory copy of the cells
+    def snapshot(self) -> 'DenseGrid':
+        return DenseGrid.from_cells(self.width, self.height,
+                                    bytearray(self.cells), self.table)
+
+    # index deltas of the neighbors (keyed by diagonal), which hold for any
+    # cell that isn't on the border, so the table is built once per grid
+    def _build_neighbor_table(self) -> dict[bool, tuple[int, ...]]:
+        return {diagonal: tuple(dy * self.width + dx for dx, dy in offsets)
+                for diagonal, offsets in ((False, ADJACENT_OFFSETS),
+                                          (True, ALL_OFFSETS))}
+
+    def in_bounds(self, point: Point) -> bool:
+        x, y = point
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def to_index(self, point: Point) -> int:
+        return point[1] * self.width + point[0]
+
+    def to_point(self, index: int) -> Point:
+        y, x = divmod(index, self.width)
+        return x, y
+
+    def get(self, point: Point, default: Optional[int] = None) -> Optional[int]:
+        if self.in_bounds(point):
+            return self.cells[self.to_index(point)]
+        return default
+
+    def __getitem__(self, point: Point) -> int:
+        if not self.in_bounds(point):
+            raise KeyError(point)
+        return self.cells[self.to_index(point)]
+
+    def __setitem__(self, point: Point, value: int):
+        if not self.in_bounds(point):
+            raise KeyError(point)
+        self.cells[self.to_index(point)] = value
+
+    def __contains__(self, point: object) -> bool:
+        return isinstance(point, tuple) and self.in_bounds(point) # type: ignore
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __iter__(self) -> Iterator[Point]:
+        return ((x, y) for y in range(self.height) for x in range(self.width))
+
+    def items(self) -> Iterator[tuple[Point, int]]:
+        return zip(iter(self), self.cells)
+
+    def values(self) -> bytearray:
+        return self.cells
+
+    def iter_rows(self) -> Iterator[str]:
+        render_table = get_render_table(self.table)
+        for start in range(0, len(self.cells), self.width):
+            row = self.cells[start:start + self.width].translate(render_table)
+            yield row.decode('latin-1')
+
+    def render(self, out: TextIO):
+        for row in self.iter_rows():
+            out.write(row)
+            out.write('\n')
+
+    def __str__(self) -> str:
+        return ''.join(f"{row}\n" for row in self.iter_rows())
+
+    # returns the neighbors a up, left, right, down (same as Grid)
+    @instrument
+    def get_neighbors(self, point: Point, default_value: Optional[int],
+                      diagonal=False) -> list[tuple[Point, Optional[int]]]:
+        x, y = point
+        offsets = ALL_OFFSETS if diagonal else ADJACENT_OFFSETS
+        return [((x + dx, y + dy), self.get((x + dx, y + dy), default_value))
+                for dx, dy in offsets]
+
+    # indices of the neighbors that are inside the grid
+    @instrument
+    def get_neighbor_indices(self, index: int, diagonal=False) -> list[int]:
+        y, x = divmod(index, self.width)
+        if 0 < x < self.width - 1 and 0 < y < self.height - 1:
+            return [index + delta for delta in self.neighbor_table[diagonal]]
+        offsets = ALL_OFFSETS if diagonal else ADJACENT_OFFSETS
+        return [index + dy * self.width + dx for dx, dy in offsets
+                if 0 <= x + dx < self.width and 0 <= y + dy < self.height]
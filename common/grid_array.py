@@ -0,0 +1,55 @@
+import functools
+
+from typing import Any
+
+import numpy as np
+
+from common.grid import ADJACENT_OFFSETS, ALL_OFFSETS, Grid
+
+# numpy is only needed by the code that imports this module, the rest of
+# common works without it
+
+# the array is indexed [y, x] and starts at the grid's top left point;
+# any hole in the grid is filled with default
+def to_array(grid: Grid, default: Any = 0) -> np.ndarray:
+    points = np.array(list(grid.keys())).reshape(-1, 2)
+    values = np.array(list(grid.values()))
+    xs = points[:, 0] - points[:, 0].min()
+    ys = points[:, 1] - points[:, 1].min()
+    array = np.full((ys.max() + 1, xs.max() + 1), default, dtype=values.dtype)
+    array[ys, xs] = values
+    return array
+
+def from_array(array: np.ndarray) -> Grid:
+    ys, xs = np.indices(array.shape).reshape(2, -1)
+    return Grid.from_dict(dict(zip(zip(xs.tolist(), ys.tolist()),
+                                   array.ravel().tolist())))
+
+# a view where view[y, x] == array[y + dy, x + dx], or fill_value if that is
+# outside the array (same as get_neighbors' default_value)
+def shift(array: np.ndarray, dx: int, dy: int,
+          fill_value: Any = 0) -> np.ndarray:
+    return _pad(array, fill_value)[1 + dy: 1 + dy + array.shape[0],
+                                   1 + dx: 1 + dx + array.shape[1]]
+
+# one shifted view per neighbor, ordered like get_neighboring_points
+def get_neighbor_views(array: np.ndarray, fill_value: Any = 0,
+                       diagonal=False) -> list[np.ndarray]:
+    padded = _pad(array, fill_value)
+    height, width = array.shape
+    offsets = ALL_OFFSETS if diagonal else ADJACENT_OFFSETS
+    return [padded[1 + dy: 1 + dy + height, 1 + dx: 1 + dx + width]
+            for dx, dy in offsets]
+
+def get_neighbor_sums(array: np.ndarray, fill_value: Any = 0,
+                      diagonal=False) -> np.ndarray:
+    return functools.reduce(np.add, get_neighbor_views(array, fill_value,
+                                                       diagonal))
+
+def get_neighbor_minimums(array: np.ndarray, fill_value: Any,
+                          diagonal=False) -> np.ndarray:
+    return functools.reduce(np.minimum, get_neighbor_views(array, fill_value,
+                                                           diagonal))
+
+def _pad(array: np.ndarray, fill_value: Any) -> np.ndarray:
+    return np.pad(array, 1, constant_values=fill_value)
@@ -0,0 +1,111 @@
+import atexit
+import functools
+import inspect
+import json
+import os
+import time
+
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+# Call counters and cumulative timers for hot functions
+#   AOC_INSTRUMENT=report.json python challenge18.py
+#   python -m runner 18,19 --instrument --report report.json
+#
+# the variable is read when a function is decorated, so with it unset the
+# decorator hands back the original function and costs nothing at all
+
+ENVIRONMENT_VARIABLE = "AOC_INSTRUMENT"
+
+F = TypeVar("F", bound=Callable)
+
+
+@dataclass
+class Counter:
+    calls: int = 0
+    seconds: float = 0.0
+    # recursive calls are counted, but only the outermost one is timed
+    depth: int = 0
+
+
+COUNTERS: dict[str, Counter] = {}
+
+
+def is_enabled() -> bool:
+    return bool(os.environ.get(ENVIRONMENT_VARIABLE))
+
+
+def get_counter(name: str) -> Counter:
+    if name not in COUNTERS:
+        COUNTERS[name] = Counter()
+    return COUNTERS[name]
+
+
+def instrument(func: F) -> F:
+    if not is_enabled():
+        return func
+    counter = get_counter(f"{func.__module__}.{func.__qualname__}")
+    if inspect.isgeneratorfunction(func):
+        return _instrument_generator(func, counter) # type: ignore
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        counter.calls += 1
+        counter.depth += 1
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            counter.depth -= 1
+            if not counter.depth:
+                counter.seconds += time.perf_counter() - start
+    return wrapper # type: ignore
+
+
+# a generator does its work as it is iterated, so time each step
+def _instrument_generator(func: Callable, counter: Counter) -> Callable:
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        counter.calls += 1
+        generator = func(*args, **kwargs)
+        while True:
+            counter.depth += 1
+            start = time.perf_counter()
+            try:
+                value = next(generator)
+            except StopIteration:
+                return
+            finally:
+                counter.depth -= 1
+                if not counter.depth:
+                    counter.seconds += time.perf_counter() - start
+            yield value
+    return wrapper
+
+
+def reset():
+    for counter in COUNTERS.values():
+        counter.calls = 0
+        counter.seconds = 0.0
+
+
+def get_report() -> dict[str, dict[str, float]]:
+    return {name: {"calls": counter.calls, "seconds": counter.seconds}
+            for name, counter in sorted(COUNTERS.items()) if counter.calls}
+
+
+def write_report(filename: str, report: dict):
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+        f.write('\n')
+
+
+def _write_report_at_exit():
+    # processes that never called anything (e.g. the runner's parent) leave
+    # the report to whoever did the work
+    if COUNTERS and (report := get_report()):
+        write_report(os.environ[ENVIRONMENT_VARIABLE], {"counters": report})
+
+
+if is_enabled():
+    atexit.register(_write_report_at_exit)
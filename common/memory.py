@@ -0,0 +1,120 @@
+import os
+import threading
+import tracemalloc
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+# Peak memory and the biggest allocation sites of a single call, using
+# tracemalloc. Tracing slows everything down a lot, so keep it out of runs
+# whose timings matter.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_INTERVAL = 0.02
+# deep enough to see past copy.deepcopy and friends into the solver
+TRACEBACK_FRAMES = 16
+
+
+@dataclass
+class AllocationSite:
+    location: str
+    size: int
+    count: int
+
+
+@dataclass
+class MemoryUsage:
+    peak: int
+    sites: list[AllocationSite] = field(default_factory=list)
+
+    @staticmethod
+    def from_dict(values: dict[str, Any]) -> 'MemoryUsage':
+        return MemoryUsage(values["peak"], [AllocationSite(**site)
+                                            for site in values["sites"]])
+
+
+# tracemalloc only knows the sites of memory that is still allocated, so
+# keep the snapshot taken closest to the peak while the call runs
+class _PeakSampler(threading.Thread):
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.stopped = threading.Event()
+        self.size = -1
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+
+    def run(self):
+        while not self.stopped.wait(SAMPLE_INTERVAL):
+            self.sample()
+
+    def sample(self):
+        if not tracemalloc.is_tracing():
+            return
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.size:
+            self.size = current
+            self.snapshot = tracemalloc.take_snapshot()
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        self.sample()
+
+
+def format_size(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.1f}{unit}" if unit != "B" else f"{size:.0f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GiB"
+
+
+def get_location(frame: tracemalloc.Frame) -> str:
+    filename = frame.filename
+    if filename.startswith(ROOT + os.sep):
+        filename = os.path.relpath(filename, ROOT)
+    return f"{filename}:{frame.lineno}"
+
+
+def is_in_repository(frame: tracemalloc.Frame) -> bool:
+    return frame.filename.startswith(ROOT + os.sep) and \
+        frame.filename != __file__
+
+
+# allocations are charged to the innermost line of this repository that led
+# to them, so a deepcopy shows up where it was called rather than in copy.py
+def get_sites(snapshot: tracemalloc.Snapshot, top: int
+              ) -> list[AllocationSite]:
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__, all_frames=True),
+        tracemalloc.Filter(False, threading.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ))
+    sites: dict[str, AllocationSite] = {}
+    for trace in snapshot.traces:
+        frames = list(reversed(trace.traceback))
+        frame = next(filter(is_in_repository, frames), frames[0])
+        location = get_location(frame)
+        site = sites.setdefault(location, AllocationSite(location, 0, 0))
+        site.size += trace.size
+        site.count += 1
+    return sorted(sites.values(), key=lambda s: s.size, reverse=True)[:top]
+
+
+def trace_memory(func: Callable, *args, top: int = 5
+                 ) -> tuple[Any, MemoryUsage]:
+    if tracemalloc.is_tracing():
+        raise RuntimeError("tracemalloc is already tracing")
+    # started first so the thread's own setup is not traced
+    sampler = _PeakSampler()
+    sampler.start()
+    tracemalloc.start(TRACEBACK_FRAMES)
+    try:
+        result = func(*args)
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        sampler.stop()
+        tracemalloc.stop()
+    sites = get_sites(sampler.snapshot, top) if sampler.snapshot else []
+    return result, MemoryUsage(peak, sites)
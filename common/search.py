@@ -0,0 +1,109 @@
+import heapq
+import itertools
+
+from dataclasses import dataclass, field
+from typing import Callable, Generic, Hashable, Iterable, Optional, TypeVar
+
+from common.instrument import instrument
+
+# Shortest path searches over implicit graphs: a node's neighbors come from
+# a function yielding (weight, neighbor) pairs, and the search stops at the
+# first node the goal function accepts.
+#
+# Every search keeps the best known cost of each node and leaves outdated
+# queue entries in place, skipping them when they come up (lazy deletion)
+
+Node = TypeVar("Node", bound=Hashable)
+Neighbors = Callable[[Node], Iterable[tuple[int, Node]]]
+
+
+@dataclass
+class SearchStats:
+    expanded: int = 0
+    pushed: int = 0
+    # queue entries skipped because a cheaper path was found after them
+    stale: int = 0
+    peak_frontier: int = 0
+
+
+@dataclass
+class SearchResult(Generic[Node]):
+    # None when no goal can be reached
+    cost: Optional[int]
+    node: Optional[Node]
+    stats: SearchStats = field(default_factory=SearchStats)
+
+
+@instrument
+def dijkstra(start: Node, neighbors: Neighbors,
+             is_goal: Callable[[Node], bool]) -> SearchResult[Node]:
+    return a_star(start, neighbors, is_goal, None)
+
+
+# the heuristic must never overestimate the remaining cost, or the first
+# goal found might not be the cheapest
+@instrument
+def a_star(start: Node, neighbors: Neighbors,
+           is_goal: Callable[[Node], bool],
+           heuristic: Optional[Callable[[Node], int]]) -> SearchResult[Node]:
+    stats = SearchStats()
+    best = {start: 0}
+    # the counter breaks ties so nodes never have to be compared
+    counter = itertools.count()
+    queue = [(heuristic(start) if heuristic else 0, next(counter), 0, start)]
+    while queue:
+        stats.peak_frontier = max(stats.peak_frontier, len(queue))
+        _, _, cost, node = heapq.heappop(queue)
+        if cost > best[node]:
+            stats.stale += 1
+            continue
+        stats.expanded += 1
+        if is_goal(node):
+            return SearchResult(cost, node, stats)
+        for weight, neighbor in neighbors(node):
+            new_cost = cost + weight
+            if new_cost < best.get(neighbor, new_cost + 1):
+                best[neighbor] = new_cost
+                priority = new_cost + heuristic(neighbor) if heuristic \
+                    else new_cost
+                heapq.heappush(queue,
+                               (priority, next(counter), new_cost, neighbor))
+                stats.pushed += 1
+    return SearchResult(None, None, stats)
+
+
+# Dijkstra for small non-negative integer weights: a ring of buckets indexed
+# by cost replaces the heap, so pushing and popping are both O(1)
+@instrument
+def bucket_search(start: Node, neighbors: Neighbors,
+                  is_goal: Callable[[Node], bool],
+                  max_weight: int) -> SearchResult[Node]:
+    stats = SearchStats()
+    best = {start: 0}
+    # every queued cost is within max_weight of the current one
+    buckets: list[list[Node]] = [[] for _ in range(max_weight + 1)]
+    buckets[0].append(start)
+    queued = 1
+    cost = 0
+    while queued:
+        bucket = buckets[cost % len(buckets)]
+        stats.peak_frontier = max(stats.peak_frontier, queued)
+        while bucket:
+            node = bucket.pop()
+            queued -= 1
+            if best[node] != cost:
+                stats.stale += 1
+                continue
+            stats.expanded += 1
+            if is_goal(node):
+                return SearchResult(cost, node, stats)
+            for weight, neighbor in neighbors(node):
+                assert 0 <= weight <= max_weight, f"Bad weight {weight}"
+                new_cost = cost + weight
+                if new_cost < best.get(neighbor, new_cost + 1):
+                    best[neighbor] = new_cost
+                    buckets[new_cost % len(buckets)].append(neighbor)
+                    queued += 1
+                    stats.pushed += 1
+        cost += 1
+    return SearchResult(None, None, stats)
@@ -0,0 +1,173 @@
+import argparse
+import collections
+import hashlib
+import json
+import os
+import signal
+import socket
+import socketserver
+import tempfile
+import time
+
+from concurrent.futures import ProcessPoolExecutor, wait
+from typing import Any
+
+from runner import get_available_days, get_module, to_json_answer
+
+# Keeps the solvers warm in a pool of worker processes behind a Unix socket
+#   python -m daemon --socket /tmp/aoc.sock --jobs 4 &
+#   python -m daemon --socket /tmp/aoc.sock --send '{"day": 7, "path": "in.txt"}'
+#
+# every request and response is one line of JSON. A request names the day,
+# optionally a part (default: every part), and where the input comes from:
+#   {"day": 7, "part": 1, "path": "input/input7.txt"}   (relative to the daemon)
+#   {"day": 7, "input": "16,1,2,0,4,2,7,1,2,14\n"}
+#   {"day": 21}                                    (days without an input)
+# and gets back {"answers": [...], "seconds": ...} or {"error": "..."}, with
+# the request's "id" copied over when it has one
+#
+# the workers import every challenge when they start, and keep the inputs
+# they have parsed (and whatever the solvers memoise) between requests
+
+# parsed inputs kept by each worker, oldest dropped first
+MAX_PARSED_INPUTS = 32
+PARSED_INPUTS: collections.OrderedDict[tuple, Any] = collections.OrderedDict()
+
+
+def warm_up():
+    # Ctrl-C reaches the whole process group, but shutting the workers down
+    # is left to the server
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    for day in get_available_days():
+        get_module(day)
+
+
+def get_parsed_input(key: tuple, parse) -> Any:
+    if key in PARSED_INPUTS:
+        PARSED_INPUTS.move_to_end(key)
+        return PARSED_INPUTS[key]
+    value = parse()
+    PARSED_INPUTS[key] = value
+    if len(PARSED_INPUTS) > MAX_PARSED_INPUTS:
+        PARSED_INPUTS.popitem(last=False)
+    return value
+
+
+def parse_text(parser, text: str) -> Any:
+    # the parsers all read from a file
+    with tempfile.NamedTemporaryFile("w", suffix=".txt",
+                                     encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        return parser(f.name)
+
+
+def get_request_input(module, request: dict[str, Any]) -> Any:
+    if not hasattr(module, "INPUT"):
+        return None
+    parser = module.INPUT.parser
+    if "input" in request:
+        text = request["input"]
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return get_parsed_input((module.__name__, digest),
+                                lambda: parse_text(parser, text))
+    path = os.path.abspath(request.get("path", module.INPUT.filename))
+    # a file that changed in place is parsed again
+    stat = os.stat(path)
+    return get_parsed_input((module.__name__, path, stat.st_size,
+                             stat.st_mtime_ns), lambda: parser(path))
+
+
+def solve_request(request: dict[str, Any]) -> dict[str, Any]:
+    start = time.perf_counter()
+    try:
+        module = get_module(int(request["day"]))
+        data = get_request_input(module, request)
+        parts = [int(request["part"])] if "part" in request \
+            else range(1, len(module.PARTS) + 1)
+        answers = [module.PARTS[part - 1](data) for part in parts]
+    except Exception as error:  # pylint: disable=broad-except
+        return {"error": repr(error)}
+    return {"answers": [to_json_answer(answer) for answer in answers],
+            "seconds": time.perf_counter() - start}
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("a request must be a JSON object")
+            except ValueError as error:
+                response = {"error": repr(error)}
+            else:
+                # the pool is shared by every connection, each in its own
+                # thread, so a slow request only holds up its own client
+                response = self.server.executor.submit( # type: ignore
+                    solve_request, request).result()
+                if "id" in request:
+                    response["id"] = request["id"]
+            self.wfile.write(json.dumps(response).encode("utf-8") + b'\n')
+            self.wfile.flush()
+
+
+class SolverServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, executor: ProcessPoolExecutor):
+        self.executor = executor
+        super().__init__(path, RequestHandler)
+
+
+def serve(path: str, jobs: int):
+    if os.path.exists(path):
+        os.remove(path)
+    with ProcessPoolExecutor(max_workers=jobs,
+                             initializer=warm_up) as executor:
+        # start every worker now rather than on the first requests
+        wait([executor.submit(os.getpid) for _ in range(jobs)])
+        with SolverServer(path, executor) as server:
+            print(f"Serving {jobs} workers on {path}", flush=True)
+            try:
+                server.serve_forever()
+            finally:
+                os.remove(path)
+
+
+def send_request(path: str, request: dict[str, Any]) -> dict[str, Any]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(path)
+        with client.makefile("rwb") as stream:
+            stream.write(json.dumps(request).encode("utf-8") + b'\n')
+            stream.flush()
+            return json.loads(stream.readline())
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve solve requests from warm worker processes")
+    parser.add_argument("--socket", "-s", default="aoc.sock",
+                        help="path of the Unix socket")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count(),
+                        help="number of worker processes")
+    parser.add_argument("--send",
+                        help="send this JSON request to a running daemon and "
+                             "print the response instead of serving")
+    args = parser.parse_args()
+
+    if args.send:
+        print(json.dumps(send_request(args.socket, json.loads(args.send))))
+        return
+    # a plain kill shuts down as cleanly as Ctrl-C
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        serve(args.socket, args.jobs)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
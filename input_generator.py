@@ -0,0 +1,354 @@
+import argparse
+import itertools
+import random
+import string
+import sys
+
+from dataclasses import dataclass
+from typing import Callable
+
+# Writes puzzle inputs of any size so the solvers can be timed against
+# inputs far larger than the real ones
+#   python -m input_generator 9 1000 > heightmap.txt
+#
+# days 21, 23 and 24 are not covered: their inputs are two starting
+# positions, a fixed burrow and a fixed program, so there is nothing to scale
+
+
+@dataclass
+class InputGenerator:
+    generate: Callable[[int, random.Random], str]
+    # what the size argument counts, for the reports
+    unit: str
+    # parts that finish on any generated input
+    parts: tuple[int, ...] = (1, 2)
+
+
+def generate_depths(size: int, rng: random.Random) -> str:
+    depths = itertools.accumulate((rng.randint(-5, 10) for _ in range(size)),
+                                  initial=100)
+    return ''.join(f"{depth}\n" for depth in depths)
+
+
+def generate_moves(size: int, rng: random.Random) -> str:
+    return ''.join(f"{rng.choice(('forward', 'down', 'up'))} "
+                   f"{rng.randint(1, 9)}\n" for _ in range(size))
+
+
+def generate_diagnostics(size: int, rng: random.Random) -> str:
+    # get_power_rate only handles 12 bit numbers
+    return ''.join(f"{rng.randrange(1 << 12):012b}\n" for _ in range(size))
+
+
+def generate_bingo(size: int, rng: random.Random) -> str:
+    draws = rng.sample(range(100), 100)
+    boards = []
+    for _ in range(size):
+        numbers = rng.sample(range(100), 25)
+        boards.append('\n'.join(' '.join(f"{n:2}" for n in numbers[i:i+5])
+                                for i in range(0, 25, 5)))
+    return ','.join(map(str, draws)) + "\n\n" + "\n\n".join(boards) + '\n'
+
+
+def generate_vents(size: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(size):
+        x1, y1 = rng.randint(200, 800), rng.randint(200, 800)
+        length = rng.randint(1, 200)
+        dx, dy = rng.choice(((1, 0), (-1, 0), (0, 1), (0, -1),
+                             (1, 1), (1, -1), (-1, 1), (-1, -1)))
+        lines.append(f"{x1},{y1} -> {x1 + dx*length},{y1 + dy*length}\n")
+    return ''.join(lines)
+
+
+def generate_timers(size: int, rng: random.Random) -> str:
+    return ','.join(str(rng.randint(1, 5)) for _ in range(size)) + '\n'
+
+
+def generate_crabs(size: int, rng: random.Random) -> str:
+    return ','.join(str(rng.randint(0, size)) for _ in range(size)) + '\n'
+
+
+DIGIT_SEGMENTS = ("abcefg", "cf", "acdeg", "acdfg", "bcdf",
+                  "abdfg", "abdefg", "acf", "abcdefg", "abcdfg")
+
+def generate_displays(size: int, rng: random.Random) -> str:
+    def scramble(segments: str) -> str:
+        letters = [wiring[s] for s in segments]
+        rng.shuffle(letters)
+        return ''.join(letters)
+
+    lines = []
+    for _ in range(size):
+        wiring = dict(zip("abcdefg", rng.sample("abcdefg", 7)))
+        patterns = [scramble(s) for s in rng.sample(DIGIT_SEGMENTS, 10)]
+        outputs = [scramble(rng.choice(DIGIT_SEGMENTS)) for _ in range(4)]
+        lines.append(f"{' '.join(patterns)} | {' '.join(outputs)}\n")
+    return ''.join(lines)
+
+
+def generate_digit_grid(size: int, rng: random.Random,
+                        digits: str = "0123456789") -> str:
+    return ''.join(''.join(rng.choices(digits, k=size)) + '\n'
+                   for _ in range(size))
+
+
+def generate_heightmap(size: int, rng: random.Random) -> str:
+    # extra nines so the basins stay walled off like the real input
+    return generate_digit_grid(size, rng, "01234567899999")
+
+
+def generate_risks(size: int, rng: random.Random) -> str:
+    return generate_digit_grid(size, rng, "123456789")
+
+
+BRACKETS = {'(': ')', '[': ']', '{': '}', '<': '>'}
+
+def generate_navigation(size: int, rng: random.Random) -> str:
+    lines = []
+    for _ in range(size):
+        corrupt = rng.random() < 0.5
+        line: list[str] = []
+        stack: list[str] = []
+        for _ in range(rng.randint(20, 100)):
+            if stack and rng.random() < 0.45:
+                closer = BRACKETS[stack.pop()]
+                if corrupt:
+                    closer = rng.choice([c for c in BRACKETS.values()
+                                         if c != closer])
+                    corrupt = False
+                line.append(closer)
+            else:
+                stack.append(rng.choice(list(BRACKETS)))
+                line.append(stack[-1])
+        # every line has to be either corrupted or incomplete
+        line.append(rng.choice(list(BRACKETS)))
+        lines.append(''.join(line) + '\n')
+    return ''.join(lines)
+
+
+def generate_caves(size: int, rng: random.Random) -> str:
+    # the number of paths grows exponentially with the number of caves
+    def names(letters: str, count: int) -> list[str]:
+        pairs = (''.join(p) for p in itertools.product(letters, repeat=2))
+        return list(itertools.islice(pairs, count))
+
+    small = names(string.ascii_lowercase, size)
+    big = names(string.ascii_uppercase, max(1, size // 3))
+    edges = {("start", rng.choice(small + big)),
+             (rng.choice(small + big), "end")}
+    for cave in small:
+        for _ in range(2):
+            edges.add((cave, rng.choice(small + big)))
+    return ''.join(f"{start}-{end}\n" for start, end in edges
+                   if start != end)
+
+
+def generate_origami(size: int, rng: random.Random) -> str:
+    # dots are placed in the final 40x6 letter area and then unfolded
+    # at random, so no dot ever ends up on a fold line
+    width, height = 40, 6
+    x_folds: list[int] = []
+    y_folds: list[int] = []
+    while width * height < 4 * size or not y_folds:
+        if len(x_folds) <= len(y_folds):
+            x_folds.append(width)
+            width = 2 * width + 1
+        else:
+            y_folds.append(height)
+            height = 2 * height + 1
+
+    def unfold(value: int, folds: list[int]) -> int:
+        for fold in folds:
+            if rng.random() < 0.5:
+                value = 2 * fold - value
+        return value
+
+    dots = {(unfold(rng.randrange(40), x_folds),
+             unfold(rng.randrange(6), y_folds)) for _ in range(size)}
+    folds = [f"fold along {axis}={value}\n"
+             for pair in itertools.zip_longest(reversed(x_folds),
+                                               reversed(y_folds))
+             for axis, value in zip("xy", pair) if value is not None]
+    return (''.join(f"{x},{y}\n" for x, y in dots) + '\n' + ''.join(folds))
+
+
+def generate_polymer(size: int, rng: random.Random) -> str:
+    elements = "BCFHKNOPSV"
+    rules = ''.join(f"{a}{b} -> {rng.choice(elements)}\n"
+                    for a, b in itertools.product(elements, repeat=2))
+    return ''.join(rng.choices(elements, k=size)) + "\n\n" + rules
+
+
+def generate_packet_bits(count: int, rng: random.Random) -> str:
+    header = f"{rng.randrange(8):03b}"
+    if count <= 1:
+        value = f"{rng.randrange(1 << 12):b}"
+        value = value.zfill(-(-len(value) // 4) * 4)
+        groups = [value[i:i+4] for i in range(0, len(value), 4)]
+        return (header + "100" +
+                ''.join(f"1{g}" for g in groups[:-1]) + f"0{groups[-1]}")
+
+    type_id = rng.choice((0, 1, 2, 3, 5, 6, 7) if count >= 3 else (0, 1, 2, 3))
+    children = 2 if type_id >= 5 else rng.randint(1, min(4, count - 1))
+    # uneven splits make for deep, lopsided trees
+    cuts = sorted(rng.sample(range(1, count - 1), children - 1))
+    sizes = [b - a for a, b in zip([0, *cuts], [*cuts, count - 1])]
+    subpackets = ''.join(generate_packet_bits(s, rng) for s in sizes)
+    if len(subpackets) < 1 << 15 and rng.random() < 0.5:
+        length = f"0{len(subpackets):015b}"
+    else:
+        length = f"1{children:011b}"
+    return header + f"{type_id:03b}" + length + subpackets
+
+
+def generate_transmission(size: int, rng: random.Random) -> str:
+    bits = generate_packet_bits(size, rng)
+    bits += '0' * (-len(bits) % 4)
+    return f"{int(bits, base=2):0{len(bits) // 4}X}\n"
+
+
+def generate_target(size: int, _: random.Random) -> str:
+    return f"target area: x={size}..{size + size // 2}, " \
+           f"y={-size}..{-size // 2}\n"
+
+
+def generate_snailfish(size: int, rng: random.Random) -> str:
+    def number(depth: int) -> str:
+        if depth == 4 or (depth and rng.random() < 0.3):
+            return str(rng.randint(0, 9))
+        return f"[{number(depth + 1)},{number(depth + 1)}]"
+    return ''.join(number(0) + '\n' for _ in range(size))
+
+
+def get_rotations() -> list[tuple[tuple[int, int], ...]]:
+    rotations = []
+    for axes in itertools.permutations(range(3)):
+        inversions = sum(a > b for a, b in itertools.combinations(axes, 2))
+        for signs in itertools.product((1, -1), repeat=3):
+            if (-1) ** inversions * signs[0] * signs[1] * signs[2] == 1:
+                rotations.append(tuple(zip(axes, signs)))
+    return rotations
+
+ROTATIONS = get_rotations()
+
+Point = tuple[int, int, int]
+
+def place_scanners(size: int, rng: random.Random
+                   ) -> tuple[list[Point], set[Point]]:
+    def cube(center: Point, low: Point, high: Point) -> Point:
+        return tuple(rng.randint(max(c - 1000, lo), min(c + 1000, hi))
+                     for c, lo, hi in zip(center, low, high)) # type: ignore
+
+    scanners: list[Point] = [(0, 0, 0)]
+    beacons: set[Point] = {cube((0, 0, 0), (-1000,) * 3, (1000,) * 3)
+                           for _ in range(20)}
+    while len(scanners) < size:
+        # each scanner overlaps a previous one by at least 12 beacons
+        parent = rng.choice(scanners)
+        axis = rng.randrange(3)
+        offset = [rng.randint(-100, 100) for _ in range(3)]
+        offset[axis] = rng.choice((-1, 1)) * rng.randint(1000, 1200)
+        scanner = tuple(p + o for p, o in zip(parent, offset))
+        low = tuple(max(a, b) - 1000 for a, b in zip(parent, scanner))
+        high = tuple(min(a, b) + 1000 for a, b in zip(parent, scanner))
+        beacons.update(cube(scanner, low, high) for _ in range(14)) # type: ignore
+        beacons.update(cube(scanner, (-10**9,) * 3, (10**9,) * 3) # type: ignore
+                       for _ in range(10))
+        scanners.append(scanner) # type: ignore
+    return scanners, beacons
+
+
+def generate_scanners(size: int, rng: random.Random) -> str:
+    scanners, beacons = place_scanners(size, rng)
+    readings = []
+    for number, scanner in enumerate(scanners):
+        rotation = ROTATIONS[0] if number == 0 else rng.choice(ROTATIONS)
+        lines = [f"--- scanner {number} ---"]
+        for beacon in beacons:
+            relative = [b - s for b, s in zip(beacon, scanner)]
+            if all(abs(r) <= 1000 for r in relative):
+                lines.append(','.join(str(relative[axis] * sign)
+                                      for axis, sign in rotation))
+        readings.append('\n'.join(lines) + '\n')
+    return '\n'.join(readings)
+
+
+def generate_image(size: int, rng: random.Random) -> str:
+    # a dark background has to stay dark, or every pixel lights up
+    enhancement = '.' + ''.join(rng.choices("#.", k=511))
+    image = ''.join(''.join(rng.choices("#.", k=size)) + '\n'
+                    for _ in range(size))
+    return enhancement + "\n\n" + image
+
+
+def generate_reboot(size: int, rng: random.Random) -> str:
+    steps = []
+    for number in range(size):
+        # most steps land in the initialization area, like the real input
+        start = rng.randint(-50, 30) if rng.random() < 0.8 \
+            else rng.randint(-100000, 100000)
+        ranges = []
+        for _ in range(3):
+            low = start + rng.randint(-10, 10)
+            ranges.append((low, low + rng.randint(0, 19)))
+        state = "on" if number == 0 or rng.random() < 0.6 else "off"
+        steps.append(f"{state} " + ','.join(f"{axis}={low}..{high}"
+                                            for axis, (low, high)
+                                            in zip("xyz", ranges)))
+    return '\n'.join(steps) + '\n'
+
+
+def generate_sea_cucumbers(size: int, rng: random.Random) -> str:
+    return ''.join(''.join(rng.choices(">v.", weights=(3, 3, 4), k=size))
+                   + '\n' for _ in range(size))
+
+
+GENERATORS: dict[int, InputGenerator] = {
+    1: InputGenerator(generate_depths, "measurements"),
+    2: InputGenerator(generate_moves, "moves"),
+    3: InputGenerator(generate_diagnostics, "numbers"),
+    4: InputGenerator(generate_bingo, "boards"),
+    5: InputGenerator(generate_vents, "lines"),
+    6: InputGenerator(generate_timers, "fish"),
+    7: InputGenerator(generate_crabs, "crabs"),
+    8: InputGenerator(generate_displays, "displays"),
+    9: InputGenerator(generate_heightmap, "grid width"),
+    10: InputGenerator(generate_navigation, "lines"),
+    # random octopodes may never all flash together
+    11: InputGenerator(generate_digit_grid, "grid width", (1,)),
+    12: InputGenerator(generate_caves, "small caves"),
+    13: InputGenerator(generate_origami, "dots"),
+    14: InputGenerator(generate_polymer, "template length"),
+    15: InputGenerator(generate_risks, "grid width"),
+    16: InputGenerator(generate_transmission, "packets"),
+    17: InputGenerator(generate_target, "target distance"),
+    18: InputGenerator(generate_snailfish, "numbers"),
+    19: InputGenerator(generate_scanners, "scanners"),
+    20: InputGenerator(generate_image, "image width"),
+    # get_all_cubes_on does not handle every overlap
+    22: InputGenerator(generate_reboot, "steps", (1,)),
+    25: InputGenerator(generate_sea_cucumbers, "grid width", (1,)),
+}
+
+
+def generate_input(day: int, size: int, seed: int = 0) -> str:
+    return GENERATORS[day].generate(size, random.Random(seed))
+
+
+def write_input(day: int, size: int, filename: str, seed: int = 0):
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(generate_input(day, size, seed))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate puzzle inputs")
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument("size", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    sys.stdout.write(generate_input(args.day, args.size, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+import argparse
+import functools
+import glob
+import importlib
+import json
+import os
+import re
+import sys
+import time
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from typing import Any, Optional
+
+from common import instrument
+from common.answer_cache import DEFAULT_FILENAME, AnswerCache, Key
+from common.file_input import get_code_hash, hash_file
+from common.memory import MemoryUsage, format_size, trace_memory
+
+# Runs the solvers for any number of days, each part in its own process
+#   python -m runner 1-25 --jobs 8
+#   python -m runner 5,22 --memory --report report.json
+#   python -m runner 7 --inputs 'inputs/day7/*.txt' > answers.jsonl
+#   python -m runner 19 --no-cache
+#
+# every challengeN module has a PARTS tuple of functions that take the day's
+# parsed input (INPUT.get(), or None for days without an input file), and
+# days with an input file also have solve(path) for solving any other file
+#
+# with --inputs every matching file is solved for the one day given, and a
+# JSON line per file is printed, in order, as the chunks of files finish
+#
+# answers are cached (see common/answer_cache.py), and a part is only run
+# again once its input, its day's module or anything in common/ changes.
+# Runs that measure the solvers (--memory, --instrument) skip the cache
+
+
+@dataclass
+class PartResult:
+    day: int
+    part: int
+    answer: Any
+    seconds: float
+    # call counts and timings of instrumented functions, when enabled
+    counters: dict[str, dict[str, float]] = field(default_factory=dict)
+    # peak memory and top allocation sites, when traced
+    memory: Optional[MemoryUsage] = None
+    # answered from the cache without solving
+    cached: bool = False
+
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def get_available_days() -> list[int]:
+    filenames = glob.glob(os.path.join(ROOT, "challenge*.py"))
+    return sorted(int(match.group(1)) for filename in filenames
+                  if (match := re.search(r"challenge(\d+)\.py$", filename)))
+
+
+def parse_days(text: str) -> list[int]:
+    days: set[int] = set()
+    for piece in text.split(','):
+        start, _, end = piece.partition('-')
+        days.update(range(int(start), int(end or start) + 1))
+    return sorted(days)
+
+
+def get_module(day: int):
+    return importlib.import_module(f"challenge{day}")
+
+
+def get_input(module) -> Any:
+    return module.INPUT.get() if hasattr(module, "INPUT") else None
+
+
+def solve_part(day: int, part: int, memory: bool = False) -> PartResult:
+    module = get_module(day)
+    data = get_input(module)
+    func = module.PARTS[part - 1]
+    usage = None
+    instrument.reset()
+    start = time.perf_counter()
+    if memory:
+        answer, usage = trace_memory(func, data)
+    else:
+        answer = func(data)
+    return PartResult(day, part, answer, time.perf_counter() - start,
+                      instrument.get_report(), usage)
+
+
+def get_jobs(days: list[int]) -> list[tuple[int, int]]:
+    return [(day, part) for day in days
+            for part in range(1, len(get_module(day).PARTS) + 1)]
+
+
+def get_answer_key(day: int, part: int) -> Optional[Key]:
+    module = get_module(day)
+    input_hash = ""
+    if hasattr(module, "INPUT"):
+        # left to fail when it is solved
+        if not os.path.exists(module.INPUT.filename):
+            return None
+        input_hash = hash_file(module.INPUT.filename)
+    # the same code hash the parsed input cache is keyed on
+    return (day, part, input_hash, get_code_hash(module.__name__))
+
+
+def run(days: list[int], jobs: int, memory: bool = False,
+        cache: Optional[AnswerCache] = None) -> list[PartResult]:
+    results = []
+    keys: dict[tuple[int, int], Optional[Key]] = {}
+    for day, part in get_jobs(days):
+        key = get_answer_key(day, part) if cache is not None else None
+        answer = cache.get(key) if cache is not None and key else None
+        if answer is None:
+            keys[day, part] = key
+            continue
+        result = PartResult(day, part, answer, 0.0, cached=True)
+        print_result(result)
+        results.append(result)
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(solve_part, day, part, memory): (day, part)
+                   for day, part in keys}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as error:  # pylint: disable=broad-except
+                day, part = futures[future]
+                print(f"Day {day:2} part {part} failed: {error!r}",
+                      flush=True)
+                continue
+            print_result(result)
+            results.append(result)
+            if cache is not None and (key := keys[futures[future]]):
+                cache.put(key, result.answer)
+    return sorted(results, key=lambda r: (r.day, r.part))
+
+
+def get_input_files(pattern: str) -> list[str]:
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, "*")
+    return sorted(path for path in glob.glob(pattern) if os.path.isfile(path))
+
+
+def to_json_answer(answer: Any) -> Any:
+    # multiline answers (e.g. day 13's code) are kept as text
+    return answer if isinstance(answer, int) else str(answer)
+
+
+def solve_file(day: int, path: str) -> dict[str, Any]:
+    start = time.perf_counter()
+    try:
+        answers = get_module(day).solve(path)
+    except Exception as error:  # pylint: disable=broad-except
+        return {"day": day, "input": path, "error": repr(error)}
+    return {"day": day, "input": path,
+            "answers": [to_json_answer(answer) for answer in answers],
+            "seconds": time.perf_counter() - start}
+
+
+def get_chunksize(files: int, jobs: int) -> int:
+    # a few chunks per worker, so one slow chunk can't hold up the end of
+    # the run while the others sit idle
+    return max(1, files // (jobs * 4))
+
+
+def run_batch(day: int, paths: list[str], jobs: int) -> int:
+    failures = 0
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for record in executor.map(functools.partial(solve_file, day), paths,
+                                   chunksize=get_chunksize(len(paths), jobs)):
+            failures += "error" in record
+            print(json.dumps(record), flush=True)
+    return failures
+
+
+def print_result(result: PartResult):
+    answer = str(result.answer)
+    if '\n' in answer:
+        answer = '\n' + answer
+    peak = f", peak {format_size(result.memory.peak):>9}" \
+        if result.memory else ""
+    seconds = f"{'cached':>9}" if result.cached else f"{result.seconds:8.3f}s"
+    print(f"Day {result.day:2} part {result.part} "
+          f"({seconds}{peak}): {answer}", flush=True)
+    # with --instrument, whether or not there is a --report to write them to
+    for name, counter in result.counters.items():
+        print(f"    {name}: {counter['calls']} calls, "
+              f"{counter['seconds']:.3f}s", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Advent of Code solvers")
+    parser.add_argument("days", nargs='?', default=None,
+                        help="days to run, e.g. 1-25 or 1,3,5-7 "
+                             "(default: every challenge)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count(),
+                        help="number of worker processes")
+    parser.add_argument("--instrument", action="store_true",
+                        help="count calls to and time the hot functions")
+    parser.add_argument("--memory", action="store_true",
+                        help="trace peak memory and the top allocation sites "
+                             "(slows the solvers down)")
+    parser.add_argument("--inputs",
+                        help="directory or glob of input files to solve "
+                             "the one given day for, printing JSON lines")
+    parser.add_argument("--cache", default=DEFAULT_FILENAME,
+                        help="SQLite file holding the cached answers")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="solve every part even if its answer is cached")
+    parser.add_argument("--report",
+                        help="JSON file to write every part's answer, time, "
+                             "counters and memory to")
+    args = parser.parse_args()
+
+    if args.instrument:
+        # has to be set before the challenges are imported
+        os.environ[instrument.ENVIRONMENT_VARIABLE] = args.report or os.devnull
+    days = parse_days(args.days) if args.days else get_available_days()
+    start = time.perf_counter()
+    if args.inputs:
+        if len(days) != 1:
+            parser.error("--inputs needs exactly one day")
+        if not hasattr(get_module(days[0]), "solve"):
+            parser.error(f"day {days[0]} has no input file to solve")
+        paths = get_input_files(args.inputs)
+        failures = run_batch(days[0], paths, args.jobs)
+        # stdout is left to the JSON lines
+        print(f"Solved {len(paths) - failures} of {len(paths)} inputs in "
+              f"{time.perf_counter() - start:.3f}s", file=sys.stderr)
+        return
+    cache = None
+    if not (args.no_cache or args.memory or args.instrument):
+        cache = AnswerCache(args.cache)
+    try:
+        results = run(days, args.jobs, args.memory, cache)
+    finally:
+        if cache is not None:
+            cache.close()
+    print(f"Solved {len(results)} parts in "
+          f"{time.perf_counter() - start:.3f}s "
+          f"({sum(r.seconds for r in results):.3f}s of solving)")
+    if args.report:
+        instrument.write_report(args.report, {
+            "parts": [asdict(r) | {"answer": str(r.answer)} for r in results]})
+
+
+if __name__ == "__main__":
+    main()
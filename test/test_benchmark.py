@@ -0,0 +1,34 @@
+def test_find_regressions():
+    from benchmark import Timing, find_regressions
+    baselines = {"1.1": Timing("a", 1.0), "1.2": Timing("b", 1.0)}
+    timings = {"1.1": Timing("a", 1.1), "1.2": Timing("b", 1.5),
+               "2.1": Timing("c", 9.0)}
+    regressions = find_regressions(timings, baselines, 0.25, 0.01)
+    assert [r.key for r in regressions] == ["1.2"]
+    assert not find_regressions(timings, baselines, 0.25, 2.0)
+
+def test_save_baselines(tmp_path):
+    from benchmark import Timing, load_baselines, save_baselines
+    filename = str(tmp_path / "benchmarks.json")
+    assert not load_baselines(filename)
+    save_baselines(filename, {"10.1": Timing("a", 1.0), "2.1": Timing("b", 2.0)})
+    save_baselines(filename, {"2.1": Timing("b", 3.0)})
+    baselines = load_baselines(filename)
+    assert list(baselines) == ["2.1", "10.1"]
+    assert baselines["2.1"].seconds == 3.0
+
+def test_get_exponent():
+    from benchmark import get_exponent
+    assert round(get_exponent((100, 1.0), (200, 4.0)), 6) == 2.0
+    assert get_exponent((100, 0.0), (200, 1.0)) is None
+
+def test_find_memory_regressions():
+    from benchmark import Timing, find_regressions
+    from common.memory import MemoryUsage
+    baselines = {"1.1": Timing("a", 1.0, MemoryUsage(4 << 20)),
+                 "1.2": Timing("b", 1.0, MemoryUsage(1000))}
+    timings = {"1.1": Timing("a", 1.0, MemoryUsage(8 << 20)),
+               "1.2": Timing("b", 1.0, MemoryUsage(9000))}
+    regressions = find_regressions(timings, baselines, 0.25, 0.01)
+    assert [(r.key, r.unit) for r in regressions] == [("1.1", "bytes")]
+    assert str(regressions[0]) == "a: 4.0MiB -> 8.0MiB (+100%)"
@@ -1,13 +1,12 @@
-from copy import deepcopy
 def test_challenge1():
     from challenge1 import MEASUREMENTS, get_number_of_increasing_measurements,get_number_of_increasing_sliding_windows
     assert get_number_of_increasing_measurements(MEASUREMENTS) == 1791
     assert get_number_of_increasing_sliding_windows(MEASUREMENTS) == 1822
 
 def test_challenge2():
-    from challenge2 import MOVES, get_position_value, get_improved_position_value
-    assert get_position_value(MOVES) == 1451208
-    assert get_improved_position_value(MOVES) == 1620141160
+    from challenge2 import TRANSFORM, get_position_value, get_improved_position_value
+    assert get_position_value(TRANSFORM) == 1451208
+    assert get_improved_position_value(TRANSFORM) == 1620141160
 
 def test_challenge3():
     from challenge3 import NUMBERS, get_power_rate, get_life_support_rating
@@ -51,7 +50,7 @@ def test_challenge10():
 
 def test_challenge11():
     from challenge11 import OCTOPODES, get_number_of_flashes, get_synchronization
-    assert get_number_of_flashes(deepcopy(OCTOPODES)) == 1667
+    assert get_number_of_flashes(OCTOPODES.snapshot()) == 1667
     assert get_synchronization(OCTOPODES) == 488
 
 def test_challenge12():
@@ -105,3 +104,91 @@ def test_challenge22():
     from challenge22 import INSTRUCTIONS, get_cubes_on_in_initialization_area
     assert get_cubes_on_in_initialization_area(INSTRUCTIONS) == 596598
     # part 2 takes too long
+
+def test_challenge1_windows():
+    import pytest
+    from challenge1 import get_number_of_increasing_windows
+    measurements = [199, 200, 208, 210, 200, 207, 240, 269, 260, 263]
+    assert get_number_of_increasing_windows(measurements, 1) == 7
+    assert get_number_of_increasing_windows(iter(measurements), 3) == 5
+    assert get_number_of_increasing_windows(measurements, 10) == 0
+    assert get_number_of_increasing_windows([], 3) == 0
+    np = pytest.importorskip("numpy")
+    for size in (1, 3, 4, 12):
+        assert get_number_of_increasing_windows(np.array(measurements), size) == \
+            get_number_of_increasing_windows(measurements, size)
+
+def test_challenge2_transform(tmp_path, monkeypatch):
+    import challenge2
+    from challenge2 import (INPUT, Transform, get_file_transform, get_improved_position_value,
+                            get_position_value, get_transform)
+    moves = [("forward", 5), ("down", 5), ("forward", 8), ("up", 3),
+             ("down", 8), ("forward", 2)]
+    transform = get_transform(moves)
+    assert get_position_value(transform) == 150
+    assert get_improved_position_value(transform) == 900
+    for i in range(len(moves) + 1):
+        assert get_transform(moves[:i]).then(get_transform(moves[i:])) == \
+            transform
+    assert Transform().then(transform) == transform
+
+    filename = tmp_path / "input2.txt"
+    filename.write_text("".join(f"{c} {n}\n" for c, n in moves))
+    monkeypatch.setattr(challenge2, "CHUNK_SIZE", 10)
+    assert get_file_transform(str(filename), jobs=1) == transform
+    assert INPUT.solve(str(filename), challenge2.PARTS) == (150, 900)
+
+def test_challenge3_ratings(monkeypatch):
+    import pytest
+    import challenge3
+    from challenge3 import find_rating, get_life_support_rating, get_power_rate, to_report
+    numbers = ["00100", "11110", "10110", "10111", "10101", "01111",
+               "00111", "11100", "10000", "11001", "00010", "01010"]
+    report = to_report(numbers)
+    assert find_rating(report) == 23
+    assert find_rating(report, inverse=True) == 10
+    assert get_life_support_rating(report) == 230
+    # the epsilon mask comes from the width of the numbers
+    assert report.ones == [7, 5, 8, 7, 5]
+    assert get_power_rate(report) == 198
+    assert get_power_rate(to_report(["1" * 70, "0" * 70, "1" * 70])) == 0
+    # a bit every candidate shares keeps them all, even for the co2 rating
+    assert find_rating(to_report(["110", "111", "111"]), inverse=True) == 6
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(challenge3, "NUMPY_MIN_DIGITS", 0)
+    assert to_report(numbers) == report
+
+def test_challenge4_wins(tmp_path):
+    from challenge4 import get_losing_board_score, get_ranked_board_score, get_winning_board_score, iter_wins, read_game
+    filename = tmp_path / "input4.txt"
+    filename.write_text(
+        "7,4,9,5,11,17,23,2,0,14,21,24,10,16,13,6,15,25,12,22,18,20,8,19,3,"
+        "26,1\n\n"
+        "22 13 17 11  0\n 8  2 23  4 24\n21  9 14 16  7\n 6 10  3 18  5\n"
+        " 1 12 20 15 19\n\n"
+        " 3 15  0  2 22\n 9 18 13 17  5\n19  8  7 25 23\n20 11 10 24  4\n"
+        "14 21 16 12  6\n\n"
+        "14 21 17 24  4\n10 16 15  9 19\n18  8 23 26 20\n22 11 13  6  5\n"
+        " 2  0 12  3  7\n")
+    game = read_game(str(filename))
+    assert [(w.board, w.turn) for w in iter_wins(game)] == \
+        [(2, 11), (0, 13), (1, 14)]
+    assert get_winning_board_score(game) == 4512
+    assert get_ranked_board_score(game, 1) == 2192
+    assert get_losing_board_score(game) == 1924
+
+    # picks up from a game in progress, without playing it any further
+    for _ in range(12):
+        game.apply_next_move()
+    assert [w.board for w in iter_wins(game)] == [0, 1]
+    assert game.next_move_index == 12
+
+def test_challenge25_herds():
+    from challenge25 import get_turns_until_stasis
+    from common.grid import DenseGrid
+    cucumbers = DenseGrid.from_bytes(
+        b"v...>>.vv>\n.vv>>.vv..\n>>.>v>...v\n>>v>>.>.v.\nv>v.vv.v..\n"
+        b">.>>..v...\n.vv..>.>v.\nv.v..>>v.v\n....v..v.>\n", None)
+    assert get_turns_until_stasis(cucumbers) == 58
+    # full rows and columns block themselves, even across the edges
+    assert get_turns_until_stasis(DenseGrid.from_bytes(b">>\nvv\n", None)) == 1
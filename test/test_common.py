@@ -0,0 +1,283 @@
+def test_read_cached(tmp_path):
+    from common.file_input import read_cached, read_numbers
+    filename = tmp_path / "input.txt"
+    filename.write_text("1\n2\n", encoding="utf-8")
+    calls = []
+    def parser(name):
+        calls.append(name)
+        return read_numbers(name)
+
+    assert read_cached(str(filename), parser) == [1, 2]
+    assert read_cached(str(filename), parser) == [1, 2]
+    assert len(calls) == 1
+
+    filename.write_text("3\n", encoding="utf-8")
+    assert read_cached(str(filename), parser) == [3]
+    assert len(calls) == 2
+
+def test_import_without_input(tmp_path, monkeypatch):
+    import importlib
+    import pytest
+    from runner import get_available_days, get_module
+    # no input/ directory here, so nothing may be read at import time
+    monkeypatch.chdir(tmp_path)
+    for day in get_available_days():
+        importlib.reload(get_module(day))
+    challenge19 = get_module(19)
+    assert challenge19.to_point("1,-2,3") == (1, -2, 3)
+    assert challenge19.subtract_points((4, 4, 4), (1, 2, 3)) == (3, 2, 1)
+    with pytest.raises(FileNotFoundError):
+        challenge19.SCANNER_READINGS  # pylint: disable=pointless-statement
+    assert not list(tmp_path.iterdir())
+
+def test_streaming_readers(tmp_path):
+    from common.file_input import iter_delimited, iter_multiline, iter_numbers
+    numbers = tmp_path / "numbers.txt"
+    numbers.write_text("1\n\n 2\n3", encoding="utf-8")
+    assert list(iter_numbers(str(numbers))) == [1, 2, 3]
+    assert list(iter_multiline(str(numbers), int)) == [1, 2, 3]
+
+    delimited = tmp_path / "delimited.txt"
+    delimited.write_text("3,4, 5\n", encoding="utf-8")
+    assert list(iter_delimited(str(delimited), func=int)) == [3, 4, 5]
+
+    empty = tmp_path / "empty.txt"
+    empty.write_text("", encoding="utf-8")
+    assert not list(iter_numbers(str(empty)))
+
+def test_get_line_ranges(tmp_path):
+    from common.file_input import get_line_ranges
+    filename = tmp_path / "lines.txt"
+    filename.write_bytes(b"aaaa\nb\ncccccc\nd")
+    data = filename.read_bytes()
+    for chunks in range(1, 10):
+        ranges = get_line_ranges(str(filename), chunks)
+        assert b"".join(data[start:stop] for start, stop in ranges) == data
+        assert all(data[stop - 1:stop] == b"\n" for _, stop in ranges[:-1])
+    assert get_line_ranges(str(tmp_path / "lines.txt"), 2) == [(0, 7), (7, 15)]
+
+def test_dense_grid():
+    from common.grid import DenseGrid, Grid
+    lines = ["123", "456"]
+    grid = Grid(lines, int)
+    dense = DenseGrid(lines)
+    assert dict(dense.items()) == dict(grid.items())
+    assert dense.get_neighbors((1, 1), 0, True) == grid.get_neighbors((1, 1), 0, True)
+    assert dense.get_neighbor_indices(dense.to_index((0, 0))) == [1, 3]
+    dense[(2, 1)] = 9
+    assert dense.get((2, 1)) == 9 and dense.get((3, 1), -1) == -1
+
+def test_grid_array():
+    import pytest
+    pytest.importorskip("numpy")
+    from common.grid import Grid
+    from common.grid_array import from_array, get_neighbor_minimums, get_neighbor_sums, to_array
+    grid = Grid(["219", "398"], int)
+    array = to_array(grid)
+    assert dict(from_array(array)) == dict(grid)
+    assert get_neighbor_sums(array, 0)[0, 1] == sum(v for _, v in grid.get_neighbors((1, 0), 0))
+    assert (array < get_neighbor_minimums(array, 10)).sum() == 2
+
+def test_dense_grid_neighbor_indices():
+    from common.grid import DenseGrid
+    dense = DenseGrid(["123", "456", "789"])
+    assert dense.get_neighbor_indices(4) == [1, 3, 5, 7]
+    assert sorted(dense.get_neighbor_indices(4, diagonal=True)) == [0, 1, 2, 3, 5, 6, 7, 8]
+    assert dense.get_neighbor_indices(8, diagonal=True) == [5, 7, 4]
+
+def test_grid_bounds():
+    from common.grid import Grid
+    grid = Grid(["12", "34"], int)
+    assert grid.get_bounds() == (0, 0, 1, 1)
+    grid[(3, -1)] = 5
+    assert grid.get_bounds() == (0, -1, 3, 1)
+    assert grid.get_max_x(-1) == 3 and grid.get_max_y(0) == 1
+    del grid[(3, -1)]
+    assert grid.get_bounds() == (0, 0, 1, 1)
+    assert len(grid.get_outskirt_points()) == 12
+
+def test_grid_from_bytes():
+    from common.grid import BITS, DIGITS, DenseGrid, Grid
+    assert Grid.from_bytes(b"12\n34\n", DIGITS) == Grid(["12", "34"], int)
+    assert Grid.from_bytes(b"#.\n.#", BITS) == Grid(["10", "01"])
+    assert Grid.from_bytes(b"v>\n..") == Grid(["v>", ".."])
+    assert Grid.from_bytes(b"12\n3\n", DIGITS).get_max_y(1) == 0
+    assert DenseGrid.from_bytes(b"12\n34\n").cells == bytearray([1, 2, 3, 4])
+
+def test_grid_render():
+    import io
+    from common.grid import Grid
+    grid = Grid(["12", "3"], int)
+    out = io.StringIO()
+    grid.render(out, empty='.')
+    assert out.getvalue() == "12\n3.\n"
+    assert list(grid.iter_rows()) == ["12", "3 "]
+    assert str(grid) == "12\n3 \n"
+
+def test_dense_grid_render():
+    from common.grid import DenseGrid
+    assert str(DenseGrid.from_bytes(b">v.\n..v\n", None)) == ">v.\n..v\n"
+    octopodes = DenseGrid(["19", "90"])
+    octopodes[(1, 0)] += 1
+    assert list(octopodes.snapshot().iter_rows()) == ["1#", "90"]
+
+def test_grid_snapshot():
+    from copy import copy
+    from common.grid import Grid
+    grid = Grid(["12", "34"], int)
+    snapshot = grid.snapshot()
+    grid[(0, 0)] = 9
+    grid[(5, 5)] = 1
+    assert snapshot[(0, 0)] == 1 and (5, 5) not in snapshot
+    assert snapshot.get_bounds() == (0, 0, 1, 1)
+    copied = copy(snapshot)
+    del copied[(1, 1)]
+    assert (1, 1) in snapshot and snapshot.get_max_x(1) == 1
+    merged = snapshot | {(2, 0): 7}
+    snapshot |= {(0, 0): 9}
+    assert merged[(0, 0)] == copied[(0, 0)] == 1 and (2, 0) not in snapshot
+    assert snapshot[(0, 0)] == 9 and merged.get_bounds() == (0, 0, 2, 1)
+
+def test_instrument(monkeypatch):
+    from common import instrument
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+    assert instrument.instrument(fib) is fib
+
+    monkeypatch.setenv(instrument.ENVIRONMENT_VARIABLE, "report.json")
+    fib = instrument.instrument(fib)
+    def count(n):
+        yield from range(n)
+    count = instrument.instrument(count)
+    instrument.reset()
+    assert fib(10) == 55
+    assert list(count(3)) == [0, 1, 2]
+
+    report = instrument.get_report()
+    assert report[f"{__name__}.test_instrument.<locals>.fib"]["calls"] == 177
+    assert report[f"{__name__}.test_instrument.<locals>.count"]["calls"] == 1
+    instrument.reset()
+    assert not instrument.get_report()
+
+def test_trace_memory():
+    from common.memory import MemoryUsage, format_size, trace_memory
+    def allocate(count):
+        blocks = [bytearray(1024) for _ in range(count)]
+        return len(blocks)
+
+    result, usage = trace_memory(allocate, 1000)
+    assert result == 1000
+    assert usage.peak >= 1000 * 1024
+    assert usage.sites[0].location.startswith("test/test_common.py:")
+    assert MemoryUsage.from_dict({"peak": 1, "sites": []}) == MemoryUsage(1)
+    assert format_size(512) == "512B"
+    assert format_size(3 << 20) == "3.0MiB"
+
+def test_search():
+    from common.search import a_star, bucket_search, dijkstra
+    graph = {'a': [(1, 'b'), (4, 'c')], 'b': [(2, 'c'), (7, 'd')],
+             'c': [(3, 'd')], 'd': [], 'e': [(1, 'a')]}
+    neighbors = graph.__getitem__
+    is_goal = lambda node: node == 'd'
+
+    result = dijkstra('a', neighbors, is_goal)
+    assert (result.cost, result.node) == (6, 'd')
+    assert result.stats.expanded == 4
+    assert result.stats.peak_frontier == 3
+    assert a_star('a', neighbors, is_goal, lambda node: 0).cost == 6
+    assert bucket_search('a', neighbors, is_goal, 7).cost == 6
+    assert dijkstra('a', neighbors, lambda node: node == 'e').cost is None
+    assert bucket_search('d', neighbors, lambda node: node == 'e', 7).cost is None
+
+    # a lattice where plenty of paths tie
+    def lattice(point):
+        x, y = point
+        return [(1 + (x * y) % 3, (x + dx, y + dy))
+                for dx, dy in ((1, 0), (0, 1)) if x + dx < 20 and y + dy < 20]
+    at_end = lambda point: point == (19, 19)
+    expected = dijkstra((0, 0), lattice, at_end).cost
+    assert bucket_search((0, 0), lattice, at_end, 3).cost == expected
+    assert a_star((0, 0), lattice, at_end,
+                  lambda p: 38 - p[0] - p[1]).cost == expected
+
+def test_automaton():
+    from common.automaton import Automaton
+    from common.grid import DenseGrid
+    # a blinker flips between a row and a column
+    blinker = DenseGrid.from_cells(5, 5, bytearray(b"\0" * 11 + b"\1\1\1" +
+                                                   b"\0" * 11))
+    automaton = Automaton(blinker)
+    buffers = list(map(id, automaton.buffers))
+    offsets = automaton.neighbor_offsets()
+    def life(cells, index):
+        alive = sum(cells[index + offset] for offset in offsets)
+        return 1 if alive == 3 or (alive == 2 and cells[index]) else 0
+    automaton.step([life])
+    # the update went into the second buffer, which is now the current one
+    assert list(map(id, automaton.buffers)) == buffers[::-1]
+    assert automaton.to_dense_grid().cells == bytearray(
+        b"\0" * 7 + b"\1" + b"\0" * 4 + b"\1" + b"\0" * 4 + b"\1" + b"\0" * 7)
+    automaton.step_n([life], 3)
+    assert automaton.to_dense_grid().cells == blinker.cells
+    assert automaton.generation == 4
+
+    # a lone cell drifting right wraps back around to where it started
+    mover = Automaton(DenseGrid.from_cells(3, 2, bytearray(b"\1\0\0\0\0\0")),
+                      wrap=True)
+    left = mover.offset(-1, 0)
+    mover.step_n([lambda cells, index: cells[index + left]], 3)
+    assert mover.to_dense_grid().cells == bytearray(b"\1\0\0\0\0\0")
+
+    # a growing board with a background that flips every generation
+    grow = Automaton(DenseGrid.from_cells(1, 1, bytearray(b"\1")), margin=2,
+                     background_rule=lambda value: 1 - value)
+    window = grow.window_offsets()
+    grow.step([lambda cells, index: max(cells[index + o] for o in window)])
+    assert grow.count(1) == 9 and grow.background == 1
+    assert grow.apply_table(bytes([1, 0]) + bytes(254))
+    assert grow.count(1) == 16 and grow.background == 0
+
+    still = Automaton(DenseGrid.from_cells(2, 2, bytearray(4)))
+    assert still.step_until_fixpoint([lambda cells, index: cells[index]]) == 1
+
+def test_answer_cache(tmp_path):
+    from common.answer_cache import AnswerCache
+    filename = str(tmp_path / "answers.cache")
+    cache = AnswerCache(filename, max_size=250)
+    assert cache.get((1, 1, "input", "code")) is None
+    cache.put((1, 1, "input", "code"), 7)
+    cache.put((1, 2, "input", "code"), "a" * 100)
+    assert cache.get((1, 1, "input", "code")) == 7
+    assert cache.get((1, 1, "input", "other code")) is None
+    cache.close()
+
+    # reopened, and the least recently used answer makes room
+    cache = AnswerCache(filename, max_size=250)
+    assert cache.get((1, 2, "input", "code")) == "a" * 100
+    cache.put((2, 1, "input", "code"), "b" * 100)
+    cache.put((2, 2, "input", "code"), "c" * 100)
+    assert len(cache) == 2
+    assert cache.get((1, 2, "input", "code")) is None
+    assert cache.get((2, 1, "input", "code")) == "b" * 100
+    cache.close()
+
+def test_read_cached_helper_edit(tmp_path, monkeypatch):
+    import importlib
+    from common.file_input import get_code_hash, read_cached
+    filename = tmp_path / "input.txt"
+    filename.write_text("1\n2\n", encoding="utf-8")
+    module = tmp_path / "cached_parser.py"
+    source = ("def to_value(text):\n    return {}\n\n"
+              "def parse(filename):\n"
+              "    with open(filename, encoding='utf-8') as f:\n"
+              "        return [to_value(line) for line in f]\n")
+    module.write_text(source.format("int(text)"), encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    cached_parser = importlib.import_module("cached_parser")
+    assert read_cached(str(filename), cached_parser.parse) == [1, 2]
+
+    # only the helper changes, the parser itself is the same code
+    module.write_text(source.format("-int(text)"), encoding="utf-8")
+    importlib.reload(cached_parser)
+    get_code_hash.cache_clear()
+    assert read_cached(str(filename), cached_parser.parse) == [-1, -2]
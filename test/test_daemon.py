@@ -0,0 +1,32 @@
+def test_solve_request(tmp_path):
+    from daemon import PARSED_INPUTS, solve_request
+    text = "199\n200\n208\n210\n200\n207\n240\n269\n260\n263\n"
+    filename = tmp_path / "input1.txt"
+    filename.write_text(text)
+    assert solve_request({"day": 1, "path": str(filename)})["answers"] == \
+        [7, 5]
+    assert solve_request({"day": 1, "part": 2, "input": text})["answers"] == \
+        [5]
+    assert len(PARSED_INPUTS) == 2
+    assert solve_request({"day": 1, "part": 1, "path": str(filename)})[
+        "answers"] == [7]
+    assert len(PARSED_INPUTS) == 2
+    assert "error" in solve_request({"day": 1, "path": str(tmp_path / "x")})
+
+def test_server(tmp_path):
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from daemon import SolverServer, send_request
+    path = str(tmp_path / "aoc.sock")
+    with ThreadPoolExecutor(2) as executor, \
+            SolverServer(path, executor) as server: # type: ignore
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            response = send_request(path, {"day": 1, "id": "a",
+                                           "input": "1\n2\n1\n3\n"})
+            assert response["answers"] == [2, 1]
+            assert response["id"] == "a"
+        finally:
+            server.shutdown()
+            thread.join()
@@ -0,0 +1,23 @@
+def test_generated_inputs_parse(tmp_path):
+    import importlib
+    from input_generator import GENERATORS, write_input
+    for day in GENERATORS:
+        filename = str(tmp_path / f"input{day}.txt")
+        write_input(day, 5, filename)
+        module = importlib.import_module(f"challenge{day}")
+        assert module.INPUT.parser(filename)
+
+def test_generated_inputs_solve(tmp_path):
+    from challenge13 import INPUT as ORIGAMI, get_visible_points_after_first_fold
+    from challenge16 import INPUT as PACKET, get_version_numbers
+    from input_generator import generate_input, write_input
+    assert generate_input(9, 20, seed=1) == generate_input(9, 20, seed=1)
+
+    write_input(13, 500, str(tmp_path / "origami.txt"))
+    instructions = ORIGAMI.parser(str(tmp_path / "origami.txt"))
+    assert get_visible_points_after_first_fold(instructions) > 0
+
+    write_input(16, 200, str(tmp_path / "packet.txt"))
+    packet = PACKET.parser(str(tmp_path / "packet.txt"))
+    assert len(list(packet.visit())) == 200
+    assert get_version_numbers(packet) >= 0
@@ -0,0 +1,24 @@
+def test_parse_days():
+    from runner import parse_days
+    assert parse_days("3") == [3]
+    assert parse_days("1-3") == [1, 2, 3]
+    assert parse_days("5-7,1,6") == [1, 5, 6, 7]
+
+def test_get_jobs():
+    from runner import get_available_days, get_jobs
+    assert get_available_days() == list(range(1, 26))
+    assert get_jobs([13, 25]) == [(13, 1), (13, 2), (25, 1)]
+
+def test_solve_file(tmp_path):
+    from runner import get_chunksize, get_input_files, solve_file
+    (tmp_path / "a.txt").write_text("199\n200\n208\n210\n200\n207\n")
+    (tmp_path / "b.txt").write_text("1\nx\n")
+    (tmp_path / "notes").mkdir()
+    paths = get_input_files(str(tmp_path))
+    assert paths == [str(tmp_path / "a.txt"), str(tmp_path / "b.txt")]
+    assert get_input_files(str(tmp_path / "a*")) == paths[:1]
+
+    assert solve_file(1, paths[0])["answers"] == [4, 1]
+    assert "ValueError" in solve_file(1, paths[1])["error"]
+    assert get_chunksize(3, 8) == 1
+    assert get_chunksize(1000, 8) == 31